@@ -0,0 +1,86 @@
+# Import standard libraries
+import os
+import random
+import tempfile
+import time
+import contextlib
+from pathlib import Path
+
+# Import project-specific modules
+import convert
+
+
+# Define benchmark constants
+CELL_COUNTS = [100, 1_000, 10_000, 50_000]  # Cells per generated script
+LINES_PER_CELL = 20
+SEED = 42
+
+
+# Function to write a synthetic script with '# %%' cells
+def generate_script(py_path, cells, lines_per_cell=LINES_PER_CELL):
+    """
+    Write a large generated .py file split into '# %%' cells.
+
+    Args:
+        py_path (Path): Destination script.
+        cells (int): Number of cells.
+        lines_per_cell (int): Code lines per cell.
+    """
+    rng = random.Random(SEED)
+    with open(py_path, "w") as f:
+        for cell in range(cells):
+            f.write("# %%\n")
+            for line in range(lines_per_cell):
+                f.write(f"value_{cell}_{line} = {rng.random()!r}  # generated\n")
+
+
+# Function to time one conversion
+def _time_run(label, convert_fn, py_path, output_path):
+    """
+    Time a converter and print its throughput.
+
+    Args:
+        label (str): Name printed next to the result.
+        convert_fn (function): Converter taking (source, output).
+        py_path (Path): Script to convert.
+        output_path (Path): Destination notebook.
+    """
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        start = time.perf_counter()
+        convert_fn(py_path, output_path)
+        elapsed = time.perf_counter() - start
+    size = py_path.stat().st_size / (1 << 20)
+    print(f"⏱️ {label:<24} {elapsed:8.3f} s  {size / elapsed:8.1f} MB/s")
+
+
+# Function to compare py→ipynb writers on large generated scripts
+def run_benchmark(cell_counts=CELL_COUNTS):
+    """
+    Compare the nbformat path against the streaming writer.
+
+    Args:
+        cell_counts (list): Script sizes to test, in cells.
+    """
+    converters = [
+        ("nbformat", convert.py_to_ipynb),
+        ("stream", convert.py_to_ipynb_stream),
+        ("stream + validate", lambda src, out: convert.py_to_ipynb_stream(src, out, validate=True))
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for cells in cell_counts:
+            py_path = Path(tmp) / f"script_{cells}.py"
+            generate_script(py_path, cells)
+            print(f"\n🧪 {cells} cells, {py_path.stat().st_size / (1 << 20):.1f} MB")
+            for label, convert_fn in converters:
+                _time_run(label, convert_fn, py_path, py_path.with_suffix(".ipynb"))
+
+
+# Command center
+if __name__ == "__main__":
+    run_benchmark()
+
+    # Quick run on small scripts
+    # run_benchmark([100, 1_000])
+
+    print("\n✅ benchmark.py successfully executed")
@@ -1,16 +1,54 @@
 # Import standard libraries
 import os
+import sys
+import json
 import shutil
+import time
+import re
+import uuid
+import queue
+import fnmatch
+import hashlib
+import argparse
+import contextlib
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 
-# Import third-party libraries
-from nbformat import read, write, v4 as nbf
-from nbformat import NO_CONVERT
+# Third-party nbformat is imported lazily inside the converters so that
+# importing this module stays cheap and free of side effects
 
 # Define current directory
 CURRENT_DIR = Path(__file__).parent
 
+# Define conversion cache location and version (bump when converters change)
+CACHE_DIR = CURRENT_DIR / ".convert_cache"
+CACHE_VERSION = 2
+
+# Define content-addressed backup store and retention policy (None keeps all)
+BACKUP_STORE = CURRENT_DIR / ".backup_store"
+BACKUP_KEEP_LAST = None  # Snapshots to keep per extension
+BACKUP_MAX_AGE_DAYS = None  # Drop snapshots older than this
+
+# Define directories never descended into by the recursive walker
+EXCLUDED_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "__pycache__", ".ipynb_checkpoints",
+    ".venv", "venv", ".tox", ".nox", ".convert_cache", ".backup_store", "*_backup_*"
+}
+
+# Define streaming notebook reader settings
+NOTEBOOK_CHUNK_SIZE = 1 << 16  # Characters read from a notebook per refill
+_JSON_STRUCTURE = re.compile(r'[\[\]{}"]')
+_JSON_STRING_SPECIAL = re.compile(r'["\\]')
+_JSON_SCALAR_END = re.compile(r'[\s,\]}]')
+
+# Define watch mode settings (watchdog is optional; without it folders are polled)
+WATCH_DEBOUNCE = 0.05  # Seconds of quiet after the last save before converting
+WATCH_POLL_INTERVAL = 0.05  # Seconds between folder scans when watchdog is missing
+# The tool's own modules, never converted or backed up even when this folder is the source
+TOOL_NAMES = ("convert.py", "benchmark.py")
+TOOL_FILES = {CURRENT_DIR.resolve() / name for name in TOOL_NAMES}
+
 # Function to convert Python script to Jupyter notebook
 def py_to_ipynb(py_file_path, output_path):
     """
@@ -20,6 +58,8 @@ def py_to_ipynb(py_file_path, output_path):
         py_file_path (Path): Path to the .py file.
         output_path (Path): Destination path for the .ipynb file.
     """
+    from nbformat import write, v4 as nbf
+
     print(f"\n🔄 Converting: {py_file_path.name} → {output_path.name}")
     with open(py_file_path, 'r') as f:
         lines = f.readlines()
@@ -42,6 +82,92 @@ def py_to_ipynb(py_file_path, output_path):
     with open(output_path, 'w', encoding='utf-8') as f:
         write(notebook, f)
 
+# Function to serialize one code cell the way nbformat.write lays it out
+def _write_code_cell(f, lines, first):
+    """
+    Write one nbformat v4 code cell into an open notebook's cell list.
+
+    Args:
+        f (file): Notebook file open for writing.
+        lines (list): Source lines of the cell.
+        first (bool): Whether this is the first cell in the list.
+    """
+    cell = {
+        "cell_type": "code",
+        "execution_count": None,
+        "id": uuid.uuid4().hex[:8],
+        "metadata": {},
+        "outputs": [],
+        "source": ''.join(lines).splitlines(keepends=True)
+    }
+    text = json.dumps(cell, indent=1, sort_keys=True, ensure_ascii=False, separators=(",", ": "))
+    f.write(("\n  " if first else ",\n  ") + text.replace("\n", "\n  "))
+
+# Context manager to write an output in full or not at all
+@contextlib.contextmanager
+def _replace_on_success(output_path):
+    """
+    Yield a sibling temp path that replaces output_path only if the block
+    finishes without error; the temp file is deleted otherwise, so a failed
+    conversion never empties or truncates an existing output.
+
+    Args:
+        output_path (Path): Final destination path.
+
+    Yields:
+        Path: Temp path to write the output to.
+    """
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+# Function to convert Python script to Jupyter notebook with a streaming writer
+def py_to_ipynb_stream(py_file_path, output_path, validate=False):
+    """
+    Convert a Python script with '# %%' markers to a .ipynb notebook without
+    building nbformat objects.
+
+    Cells are written as soon as their closing marker is read, so memory is
+    bounded by the largest cell. The output matches nbformat.write. It is
+    written to a temp file and only moved into place once it is complete
+    (and valid, with validate=True).
+
+    Args:
+        py_file_path (Path): Path to the .py file.
+        output_path (Path): Destination path for the .ipynb file.
+        validate (bool): Validate the written notebook with nbformat.
+    """
+    print(f"\n🔄 Converting: {py_file_path.name} → {output_path.name}")
+    cell_count = 0
+    code_buffer = []
+
+    with _replace_on_success(output_path) as tmp_path:
+        with open(py_file_path, 'r') as src, open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('{\n "cells": [')
+
+            for line in src:
+                if line.strip().startswith('# %%'):
+                    if code_buffer:
+                        _write_code_cell(f, code_buffer, cell_count == 0)
+                        cell_count += 1
+                        code_buffer = []
+                else:
+                    code_buffer.append(line)
+
+            if code_buffer:
+                _write_code_cell(f, code_buffer, cell_count == 0)
+                cell_count += 1
+
+            f.write('\n ],' if cell_count else '],')
+            f.write('\n "metadata": {},\n "nbformat": 4,\n "nbformat_minor": 5\n}\n')
+
+        if validate:
+            import nbformat
+            nbformat.validate(nbformat.read(tmp_path, as_version=4))
+
 # Function to convert Jupyter notebook to Python script with cell markers
 def ipynb_to_py(ipynb_file_path, output_path):
     """
@@ -51,6 +177,8 @@ def ipynb_to_py(ipynb_file_path, output_path):
         ipynb_file_path (Path): Path to the .ipynb file.
         output_path (Path): Destination path for the .py file.
     """
+    from nbformat import read, NO_CONVERT
+
     print(f"\n🔄 Converting: {ipynb_file_path.name} → {output_path.name}")
     with open(ipynb_file_path, 'r', encoding='utf-8') as f:
         notebook = read(f, as_version=NO_CONVERT)
@@ -61,77 +189,1030 @@ def ipynb_to_py(ipynb_file_path, output_path):
                 f.write("# %%\n")
                 f.write(cell.source + '\n\n')
 
+# Pull parser that reads notebook cells without materializing outputs
+class _NotebookCellReader:
+    """
+    Incremental reader for the 'cells' list of an nbformat v4 notebook.
+
+    Values are scanned in fixed-size chunks; only the fields asked for are
+    accumulated and decoded, everything else (outputs, metadata, images)
+    is skipped as it streams past.
+
+    Args:
+        f (file): Notebook file open in text mode.
+        chunk_size (int): Characters read per refill.
+    """
+
+    def __init__(self, f, chunk_size=NOTEBOOK_CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+
+    def iter_cells(self, fields=("cell_type", "source")):
+        """
+        Yield the requested fields of each cell, in notebook order.
+
+        Args:
+            fields (tuple): Cell keys to decode; all other keys are skipped.
+
+        Yields:
+            dict: Decoded fields of one cell.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            return
+
+        while True:
+            key = self._read_key()
+            if key == "cells":
+                yield from self._iter_cell_list(fields)
+            else:
+                self._scan_value(keep=False)
+            if self._next() == "}":
+                return
+
+    def _iter_cell_list(self, fields):
+        self._expect("[")
+        if self._peek() == "]":
+            self._next()
+            return
+
+        while True:
+            cell = {}
+            self._expect("{")
+            if self._peek() != "}":
+                while True:
+                    key = self._read_key()
+                    if key in fields:
+                        cell[key] = json.loads(self._scan_value(keep=True))
+                    else:
+                        self._scan_value(keep=False)
+                    if self._next() == "}":
+                        break
+            else:
+                self._next()
+            yield cell
+
+            if self._next() == "]":
+                return
+
+    def _fill(self):
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of notebook JSON")
+
+    def _next(self):
+        char = self._peek()
+        self._pos += 1
+        return char
+
+    def _expect(self, char):
+        found = self._next()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in notebook JSON, found {found!r}")
+
+    def _read_key(self):
+        key = json.loads(self._scan_value(keep=True))
+        self._expect(":")
+        return key
+
+    def _scan_value(self, keep):
+        # Walk one JSON value, keeping its text only when asked to
+        parts = []
+        first = self._peek()
+
+        if first not in '[{"':
+            while True:
+                match = _JSON_SCALAR_END.search(self._buffer, self._pos)
+                end = match.start() if match else len(self._buffer)
+                parts.append(self._buffer[self._pos:end])
+                self._pos = end
+                if match or not self._fill():
+                    return "".join(parts)
+
+        depth = 0
+        in_string = False
+        escape = False
+        while True:
+            start = self._pos
+            pos = start + 1 if escape else start
+            escape = False
+            done = False
+
+            while not done:
+                if in_string:
+                    match = _JSON_STRING_SPECIAL.search(self._buffer, pos)
+                    if match is None:
+                        pos = len(self._buffer)
+                        break
+                    if match.group() == "\\":
+                        if match.end() == len(self._buffer):
+                            pos = match.end()
+                            escape = True
+                            break
+                        pos = match.end() + 1
+                        continue
+                    pos = match.end()
+                    in_string = False
+                    done = depth == 0
+                else:
+                    match = _JSON_STRUCTURE.search(self._buffer, pos)
+                    if match is None:
+                        pos = len(self._buffer)
+                        break
+                    pos = match.end()
+                    token = match.group()
+                    if token == '"':
+                        in_string = True
+                    elif token in "[{":
+                        depth += 1
+                    else:
+                        depth -= 1
+                        done = depth == 0
+
+            if keep:
+                parts.append(self._buffer[start:pos])
+            self._pos = pos
+            if done:
+                return "".join(parts) if keep else None
+            if not self._fill():
+                raise ValueError("Unexpected end of notebook JSON")
+
+# Function to convert Jupyter notebook to Python script without loading it whole
+def ipynb_to_py_stream(ipynb_file_path, output_path):
+    """
+    Convert a .ipynb notebook into a .py script using '# %%' cell markers,
+    parsing the notebook incrementally.
+
+    Only 'cell_type' and 'source' are decoded; outputs are skipped without
+    being materialized, so peak memory follows the largest code cell rather
+    than the file size. The output matches ipynb_to_py. It is written to a
+    temp file and only moved into place once the whole notebook parsed, so a
+    malformed notebook leaves no empty or partial script behind.
+
+    Args:
+        ipynb_file_path (Path): Path to the .ipynb file.
+        output_path (Path): Destination path for the .py file.
+    """
+    print(f"\n🔄 Converting: {ipynb_file_path.name} → {output_path.name}")
+    with _replace_on_success(output_path) as tmp_path:
+        with open(ipynb_file_path, 'r', encoding='utf-8') as src, open(tmp_path, 'w') as f:
+            for cell in _NotebookCellReader(src).iter_cells():
+                if cell.get("cell_type") == 'code':
+                    source = cell.get("source", "")
+                    if isinstance(source, list):
+                        source = ''.join(source)
+                    f.write("# %%\n")
+                    f.write(source + '\n\n')
+
+# Function to hash a file for the backup store
+def _file_digest(path):
+    """
+    Compute the SHA-256 of a file's content.
+
+    Args:
+        path (Path): File to hash.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Function to place a file at a new path without copying its data when possible
+def _link_or_copy(source, destination):
+    """
+    Hardlink a file, falling back to a reflink and then to a plain copy.
+
+    Args:
+        source (Path): Existing file.
+        destination (Path): New path for the same content.
+    """
+    try:
+        os.link(source, destination)
+        return
+    except OSError:
+        pass
+
+    try:
+        import fcntl
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), 0x40049409, src.fileno())  # FICLONE
+        return
+    except (ImportError, OSError):
+        destination.unlink(missing_ok=True)
+
+    shutil.copy2(source, destination)
+
 # Function to back up and clean converted files
-def backup_and_clean(extension):
+def backup_and_clean(extension, files=None, root=None, digests=None):
     """
-    Move all files of the given extension (excluding key scripts) to a timestamped backup directory.
+    Move all files of the given extension (excluding the tool's own modules) to a timestamped backup directory.
+
+    File content is stored once in a content-addressed store and the backup
+    directory only holds links to it, so unchanged files cost no extra disk.
+    A manifest of each snapshot is kept for retention and eviction.
 
     Args:
         extension (str): File extension to back up (e.g., 'py', 'ipynb').
+        files (list): Files to back up (defaults to *.{extension} in root).
+        root (Path): Folder holding the backup directory (defaults to CURRENT_DIR).
+        digests (dict): File → SHA-256 already computed, so it is not hashed again.
     """
+    root = Path(root) if root else CURRENT_DIR
+    files_to_move = files if files is not None else root.glob(f"*.{extension}")
+    digests = digests or {}
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = CURRENT_DIR / f"{extension}_backup_{timestamp}"
+    backup_dir = root / f"{extension}_backup_{timestamp}"
+    objects_dir = BACKUP_STORE / "objects"
+    snapshots_dir = BACKUP_STORE / "snapshots"
 
     print(f"\n📦 Creating versioned backup folder:")
     print(backup_dir)
 
     backup_dir.mkdir()
+    objects_dir.mkdir(parents=True, exist_ok=True)
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    stored = 0
+    for f in files_to_move:
+        if not (f.name in TOOL_NAMES and Path(f).resolve() in TOOL_FILES):
+            relative = Path(f).relative_to(root)
+            digest = digests.get(f) or _file_digest(f)
+            blob = objects_dir / digest
+            if not blob.exists():
+                _link_or_copy(f, blob)
+                blob.chmod(0o444)
+                stored += 1
+            (backup_dir / relative).parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(blob, backup_dir / relative)
+            f.unlink()
+            files[relative.as_posix()] = digest
+
+    manifest = {
+        "snapshot": backup_dir.name,
+        "path": str(backup_dir),
+        "extension": extension,
+        "created": time.time(),
+        "files": files
+    }
+    with open(snapshots_dir / f"{backup_dir.name}.json", 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"\n📁 Backed up {len(files)} files ({stored} new blobs, {len(files) - stored} deduplicated)")
+
+    prune_backups(BACKUP_KEEP_LAST, BACKUP_MAX_AGE_DAYS, extension)
+
+# Function to apply the backup retention policy and evict unused blobs
+def prune_backups(keep_last=None, max_age_days=None, extension=None):
+    """
+    Delete old backup snapshots and the blobs no snapshot references anymore.
+
+    The blob sweep runs on every prune, not only when a snapshot expires,
+    so blobs left behind by an interrupted backup (stored before its
+    manifest was written) are removed too.
+
+    Args:
+        keep_last (int): Keep only the newest N snapshots per extension.
+        max_age_days (float): Delete snapshots older than this many days.
+        extension (str): Only prune snapshots of this extension.
+    """
+    snapshots_dir = BACKUP_STORE / "snapshots"
+    objects_dir = BACKUP_STORE / "objects"
+    if not snapshots_dir.exists():
+        return
+
+    manifests = []
+    for path in snapshots_dir.glob("*.json"):
+        with open(path, 'r') as f:
+            manifests.append((path, json.load(f)))
+    manifests.sort(key=lambda item: item[1]["created"], reverse=True)
+
+    now = time.time()
+    kept_per_ext = {}
+    expired = []
+    for path, manifest in manifests:
+        ext = manifest["extension"]
+        if extension is not None and ext != extension:
+            continue
+        kept_per_ext[ext] = kept_per_ext.get(ext, 0) + 1
+        too_many = keep_last is not None and kept_per_ext[ext] > keep_last
+        too_old = max_age_days is not None and now - manifest["created"] > max_age_days * 86400
+        if too_many or too_old:
+            expired.append((path, manifest))
+
+    for path, manifest in expired:
+        print(f"\n🗑️ Removing backup snapshot {manifest['snapshot']}")
+        shutil.rmtree(manifest.get("path", CURRENT_DIR / manifest["snapshot"]), ignore_errors=True)
+        path.unlink()
+
+    # Evict blobs that no remaining snapshot references
+    expired_paths = {path for path, _ in expired}
+    referenced = set()
+    for path, manifest in manifests:
+        if path not in expired_paths:
+            referenced.update(manifest["files"].values())
+
+    evicted = 0
+    for blob in objects_dir.iterdir() if objects_dir.exists() else ():
+        if blob.name not in referenced:
+            blob.unlink()
+            evicted += 1
+
+    if evicted:
+        print(f"\n♻️ Evicted {evicted} unreferenced blobs")
+
+# Function to compute the cache key of a source file
+def _cache_key(convert_fn, source_digest):
+    """
+    Hash a source file's content digest together with the converter identity.
+
+    Args:
+        convert_fn (function): Function used for conversion.
+        source_digest (str): SHA-256 of the file to convert (see _file_digest).
+
+    Returns:
+        str: Hex digest identifying the conversion output.
+    """
+    return hashlib.sha256(f"{CACHE_VERSION}:{convert_fn.__name__}:{source_digest}".encode()).hexdigest()
+
+# Function to load the index of outputs written by previous runs
+def _load_cache_index(cache_dir):
+    """
+    Load the index that maps output paths to the cache key they hold.
+
+    Args:
+        cache_dir (Path): Conversion cache directory.
+
+    Returns:
+        dict: Output path → {'key', 'size', 'mtime', 'source'}.
+    """
+    try:
+        with open(cache_dir / "index.json", 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+# Function to save the index of outputs written by this run
+def _save_cache_index(cache_dir, index):
+    """
+    Atomically save the output index of the conversion cache.
+
+    Args:
+        cache_dir (Path): Conversion cache directory.
+        index (dict): Output path → {'key', 'size', 'mtime', 'source'}.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_dir / "index.json.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, cache_dir / "index.json")
+
+# Function to run one conversion through the content-hash cache
+def _convert_cached(convert_fn, source_path, output_path, cache_dir, entry):
+    """
+    Convert a file unless an identical source was converted before.
+
+    Args:
+        convert_fn (function): Function to apply for conversion.
+        source_path (Path): File to convert.
+        output_path (Path): Destination path.
+        cache_dir (Path): Conversion cache directory.
+        entry (dict): Index entry of output_path from a previous run, or None.
+
+    Returns:
+        tuple: (status, index entry) where status is 'skipped', 'restored'
+            or 'converted'; the entry's 'source' is the source file's SHA-256.
+    """
+    source_digest = _file_digest(source_path)
+    key = _cache_key(convert_fn, source_digest)
 
-    for f in CURRENT_DIR.glob(f"*.{extension}"):
-        if f.name not in {"converter.py", "main.py"}:
-            print(f"\n📁 Moving {f.name} →")
-            print(backup_dir / f.name)
-            shutil.move(f, backup_dir / f.name)
+    # Output already holds this exact conversion: nothing to do
+    if entry and entry["key"] == key and output_path.exists():
+        stat = output_path.stat()
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime"]:
+            return "skipped", entry
+
+    blob = cache_dir / output_path.suffix.lstrip('.') / key
+    if blob.exists():
+        shutil.copyfile(blob, output_path)
+        status = "restored"
+    else:
+        convert_fn(source_path, output_path)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp_blob = blob.with_name(f"{key}.{os.getpid()}.tmp")
+        shutil.copyfile(output_path, tmp_blob)
+        os.replace(tmp_blob, blob)
+        status = "converted"
+
+    stat = output_path.stat()
+    return status, {"key": key, "size": stat.st_size, "mtime": stat.st_mtime_ns, "source": source_digest}
+
+# Function to convert a single file without letting its failure escape
+def _convert_one(convert_fn, source_path, output_path, quiet=False, cache_dir=None, entry=None):
+    """
+    Run one conversion and capture any error instead of raising it.
+
+    Args:
+        convert_fn (function): Function to apply for conversion.
+        source_path (Path): File to convert.
+        output_path (Path): Destination path.
+        quiet (bool): Suppress the per-file progress output.
+        cache_dir (Path): Conversion cache directory, or None to disable it.
+        entry (dict): Index entry of output_path from a previous run, or None.
+
+    Returns:
+        tuple: (source_path, status, error message or None, index entry).
+    """
+    try:
+        with contextlib.ExitStack() as stack:
+            if quiet:
+                sink = stack.enter_context(open(os.devnull, "w"))
+                stack.enter_context(contextlib.redirect_stdout(sink))
+            if cache_dir is None:
+                convert_fn(source_path, output_path)
+                return source_path, "converted", None, None
+            status, entry = _convert_cached(convert_fn, source_path, output_path, cache_dir, entry)
+            return source_path, status, None, entry
+    except Exception as e:
+        return source_path, "failed", f"{type(e).__name__}: {e}", None
+
+# Generator to stream source files as they are discovered
+def _iter_source_files(root, extension, recursive=False, include=None, exclude=None):
+    """
+    Yield files with the given extension under root, as the walk finds them.
+
+    Uses os.scandir with an explicit stack, never descends into EXCLUDED_DIRS
+    or virtualenvs (folders holding pyvenv.cfg), skips the tool's own modules
+    (TOOL_FILES), and filters relative paths with fnmatch-style
+    include/exclude patterns.
+
+    Args:
+        root (Path): Folder to search.
+        extension (str): File extension to match (e.g., 'py').
+        recursive (bool): Descend into subfolders.
+        include (list): Patterns a relative path must match (any of).
+        exclude (list): Patterns that drop a relative path or folder.
+
+    Yields:
+        Path: Each matching file.
+    """
+    suffix = f".{extension}"
+    exclude = list(exclude or [])
+    stack = [root]
+
+    while stack:
+        folder = stack.pop()
+        try:
+            entries = os.scandir(folder)
+        except OSError as e:
+            print(f"\n⚠️ Cannot read {folder}: {e}")
+            continue
+
+        with entries:
+            for entry in entries:
+                relative = Path(entry.path).relative_to(root).as_posix()
+                if entry.is_dir(follow_symlinks=False):
+                    if not recursive:
+                        continue
+                    if any(fnmatch.fnmatch(entry.name, p) for p in EXCLUDED_DIRS):
+                        continue
+                    if any(fnmatch.fnmatch(relative, p) for p in exclude):
+                        continue
+                    if os.path.exists(os.path.join(entry.path, "pyvenv.cfg")):
+                        continue
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    if include and not any(fnmatch.fnmatch(relative, p) for p in include):
+                        continue
+                    if any(fnmatch.fnmatch(relative, p) for p in exclude):
+                        continue
+                    if entry.name in TOOL_NAMES and Path(entry.path).resolve() in TOOL_FILES:
+                        continue
+                    yield Path(entry.path)
 
 # Function to perform batch conversion
-def convert(source_ext, dest_ext, convert_fn):
+def convert(source_ext, dest_ext, convert_fn, jobs=1, cache=True,
+            root=None, recursive=False, include=None, exclude=None, executor=None):
     """
     Convert all files from one extension to another using a specified function.
 
+    Each file is converted in isolation, so one bad file does not stop the
+    batch. With jobs > 1 files are converted on a process pool and only an
+    aggregate report is printed. With the cache enabled, files whose
+    content was converted before are skipped or restored from the cache,
+    and only the sources actually converted are moved to the backup.
+    Files are handed to the converters as soon as the walk discovers them.
+
     Args:
         source_ext (str): Source file extension.
         dest_ext (str): Destination file extension.
         convert_fn (function): Function to apply for conversion.
+        jobs (int): Number of worker processes (None for CPU count); with an
+            executor, the number of workers it was started with.
+        cache (bool): Reuse outputs keyed by source content hash.
+        root (Path): Folder to convert (defaults to CURRENT_DIR).
+        recursive (bool): Also convert files in subfolders.
+        include (list): fnmatch patterns of relative paths to convert.
+        exclude (list): fnmatch patterns of relative paths or folders to skip.
+        executor (ProcessPoolExecutor): Long-lived pool to reuse instead of
+            starting one for this call.
+
+    Returns:
+        dict: Source path → error message for every failed file.
     """
-    source_folder = CURRENT_DIR
-    source_files = list(source_folder.glob(f"*.{source_ext}"))
+    source_folder = Path(root).expanduser() if root else CURRENT_DIR
+    source_files = _iter_source_files(source_folder, source_ext, recursive, include, exclude)
 
-    if not source_files:
+    jobs = jobs or os.cpu_count() or 1
+    cache_dir = CACHE_DIR if cache else None
+    index = _load_cache_index(CACHE_DIR) if cache else {}
+
+    results = []
+    if jobs == 1 and executor is None:
+        for f in source_files:
+            out = f.with_suffix(f".{dest_ext}")
+            results.append(_convert_one(convert_fn, f, out, False, cache_dir, index.get(str(out))))
+    else:
+        print(f"\n🚀 Converting .{source_ext} files with {jobs} workers...")
+        pending = set()
+        with contextlib.ExitStack() as stack:
+            pool = executor or stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+            for f in source_files:
+                out = f.with_suffix(f".{dest_ext}")
+                pending.add(pool.submit(_convert_one, convert_fn, f, out, True, cache_dir, index.get(str(out))))
+
+                # Bound the in-flight work so the walk never runs far ahead
+                if len(pending) >= jobs * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+            results.extend(future.result() for future in pending)
+
+    if not results:
         print(f"\n❌ No .{source_ext} files found in:")
         print(source_folder)
-        return
+        return {}
+
+    counts = {"converted": 0, "restored": 0, "skipped": 0, "failed": 0}
+    failures = {}
+    for f, status, error, entry in results:
+        counts[status] += 1
+        if error is not None:
+            failures[f] = error
+        elif entry is not None:
+            index[str(f.with_suffix(f".{dest_ext}"))] = entry
+
+    if cache:
+        _save_cache_index(CACHE_DIR, index)
+
+    print(f"\n📊 {len(results)} .{source_ext} files: {counts['converted']} converted, "
+          f"{counts['restored']} restored from cache, {counts['skipped']} unchanged, "
+          f"{counts['failed']} failed")
+    for f, error in failures.items():
+        print(f"❌ {f.relative_to(source_folder)}: {error}")
 
-    for f in source_files:
-        out_file = f.with_suffix(f".{dest_ext}")
-        convert_fn(f, out_file)
+    # Keep sources in place when something failed so nothing is lost, and
+    # only back up sources this run converted so unchanged ones are not touched
+    converted = {f: entry and entry["source"] for f, status, _, entry in results if status == "converted"}
+    if failures:
+        print(f"\n⚠️ Skipping backup: {len(failures)} files failed to convert")
+    elif converted:
+        backup_and_clean(source_ext, list(converted), source_folder, converted)
 
-    backup_and_clean(source_ext)
+    return failures
 
 # Function to trigger conversion by option number
-def convert_by_number(conversion_index):
+def convert_by_number(conversion_index, jobs=1, cache=True, **walk_options):
     """
     Dispatch conversion logic based on a numeric option.
 
     Args:
-        conversion_index (int): 1 for ipynb→py, 2 for py→ipynb.
+        conversion_index (int): 1 for ipynb→py, 2 for py→ipynb,
+            3 for py→ipynb with the streaming writer,
+            4 for ipynb→py with the streaming reader.
+        jobs (int): Number of worker processes (None for CPU count).
+        cache (bool): Reuse outputs keyed by source content hash.
+        **walk_options: root, recursive, include, exclude and executor for convert().
+
+    Returns:
+        dict: Source path → error message for every failed file.
 
     Raises:
         ValueError: If an unsupported index is provided.
     """
     if conversion_index == 1:
-        convert("ipynb", "py", ipynb_to_py)
+        return convert("ipynb", "py", ipynb_to_py, jobs, cache, **walk_options)
     elif conversion_index == 2:
-        convert("py", "ipynb", py_to_ipynb)
+        return convert("py", "ipynb", py_to_ipynb, jobs, cache, **walk_options)
+    elif conversion_index == 3:
+        return convert("py", "ipynb", py_to_ipynb_stream, jobs, cache, **walk_options)
+    elif conversion_index == 4:
+        return convert("ipynb", "py", ipynb_to_py_stream, jobs, cache, **walk_options)
     else:
         raise ValueError(f"Unsupported conversion index: {conversion_index}")
 
+# Function to convert one file chosen by its extension
+def convert_file(source_path, output_path=None, cache=True):
+    """
+    Convert a single .py or .ipynb file to the other format.
+
+    Args:
+        source_path (Path): File to convert.
+        output_path (Path): Destination path (defaults to the other extension).
+        cache (bool): Reuse outputs keyed by source content hash.
+
+    Returns:
+        str: 'converted', 'restored' or 'skipped'.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+    """
+    source_path = Path(source_path).expanduser()
+    converters = {".py": (py_to_ipynb, ".ipynb"), ".ipynb": (ipynb_to_py, ".py")}
+    if source_path.suffix not in converters:
+        raise ValueError(f"Unsupported file extension: {source_path.suffix}")
+
+    convert_fn, dest_suffix = converters[source_path.suffix]
+    output_path = Path(output_path) if output_path else source_path.with_suffix(dest_suffix)
+
+    if not cache:
+        convert_fn(source_path, output_path)
+        return "converted"
+
+    index = _load_cache_index(CACHE_DIR)
+    status, entry = _convert_cached(convert_fn, source_path, output_path, CACHE_DIR, index.get(str(output_path)))
+    index[str(output_path)] = entry
+    _save_cache_index(CACHE_DIR, index)
+    return status
+
+# Function to serve conversion jobs from a long-lived process
+def serve(jobs=1, requests=None, responses=None):
+    """
+    Accept conversion jobs as JSON lines and answer each with one JSON line.
+
+    The process, its imports and its worker pool stay warm across jobs.
+    A job is either {"source": path, "output": path?} for one file, or
+    {"conversion": 1|2, "root": ..., "recursive": ..., ...} for a batch;
+    an optional "id" is echoed back. Progress output goes to stderr.
+
+    Args:
+        jobs (int): Worker processes kept for batch jobs (None for CPU count).
+        requests (file): Stream of job lines (defaults to stdin).
+        responses (file): Stream for result lines (defaults to stdout).
+    """
+    requests = requests or sys.stdin
+    responses = responses or sys.stdout
+    jobs = jobs or os.cpu_count() or 1
+
+    with contextlib.ExitStack() as stack:
+        executor = stack.enter_context(ProcessPoolExecutor(max_workers=jobs)) if jobs > 1 else None
+
+        for line in requests:
+            if not line.strip():
+                continue
+
+            job = {}
+            try:
+                job = json.loads(line)
+                with contextlib.redirect_stdout(sys.stderr):
+                    if "source" in job:
+                        status = convert_file(job["source"], job.get("output"), job.get("cache", True))
+                        response = {"ok": True, "status": status}
+                    else:
+                        options = {k: job[k] for k in ("root", "recursive", "include", "exclude") if k in job}
+                        failures = convert_by_number(
+                            job.get("conversion", 2), jobs, job.get("cache", True),
+                            executor=executor, **options
+                        )
+                        response = {"ok": not failures, "failures": {str(k): v for k, v in failures.items()}}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+            response["id"] = job.get("id") if isinstance(job, dict) else None
+            responses.write(json.dumps(response) + "\n")
+            responses.flush()
+
+# Function to check whether a changed path belongs to the watched set
+def _watch_match(path, root, suffixes, recursive=False, include=None, exclude=None):
+    """
+    Apply the walker's folder and pattern rules to a single path.
+
+    Args:
+        path (Path): Changed file.
+        root (Path): Watched folder.
+        suffixes (set): Source suffixes being watched (e.g., {'.py'}).
+        recursive (bool): Whether subfolders are watched.
+        include (list): Patterns a relative path must match (any of).
+        exclude (list): Patterns that drop a relative path or folder.
+
+    Returns:
+        bool: True if the path should be converted.
+    """
+    if path.suffix not in suffixes:
+        return False
+    try:
+        relative = path.relative_to(root)
+    except ValueError:
+        return False
+
+    folders = relative.parts[:-1]
+    if folders and not recursive:
+        return False
+    for i, name in enumerate(folders):
+        if any(fnmatch.fnmatch(name, p) for p in EXCLUDED_DIRS):
+            return False
+        if any(fnmatch.fnmatch("/".join(folders[:i + 1]), p) for p in exclude or []):
+            return False
+
+    relative = relative.as_posix()
+    if include and not any(fnmatch.fnmatch(relative, p) for p in include):
+        return False
+    return not any(fnmatch.fnmatch(relative, p) for p in exclude or [])
+
+# Function to read the (size, mtime) signature of a file
+def _stat_signature(path):
+    """
+    Read a file's size and modification time without opening it.
+
+    Args:
+        path (Path): File to check.
+
+    Returns:
+        tuple: (size, mtime in ns) of the file, or None if it is gone.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+# Function to snapshot source signatures for the polling fallback
+def _scan_signatures(root, suffixes, recursive=False):
+    """
+    Walk a folder once and record the signature of every source file.
+
+    Cheaper than _iter_source_files for repeated scans: paths stay strings
+    and include/exclude patterns are only applied to files that changed.
+
+    Args:
+        root (Path): Folder to scan.
+        suffixes (tuple): Source suffixes to record (e.g., ('.py',)).
+        recursive (bool): Descend into subfolders.
+
+    Returns:
+        dict: Path string → (size, mtime in ns).
+    """
+    signatures = {}
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(suffixes):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    signatures[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    if not any(fnmatch.fnmatch(entry.name, p) for p in EXCLUDED_DIRS):
+                        stack.append(entry.path)
+    return signatures
+
+# Function to start filesystem event delivery through watchdog
+def _start_observer(root, recursive, events):
+    """
+    Push the path and time of every file event under root onto a queue.
+
+    Args:
+        root (Path): Folder to watch.
+        recursive (bool): Also watch subfolders.
+        events (queue.Queue): Receives (path string, monotonic time) pairs.
+
+    Returns:
+        Observer: Running watchdog observer, or None if watchdog is missing.
+    """
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return None
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Reads (opened / closed without writing) would retrigger conversions
+            if event.is_directory or event.event_type not in {"created", "modified", "moved", "closed"}:
+                return
+            # Editors often save through a temp file renamed over the target
+            now = time.monotonic()
+            for path in (getattr(event, "dest_path", ""), event.src_path):
+                if path:
+                    events.put((os.fsdecode(path), now))
+
+    observer = Observer()
+    observer.schedule(_Handler(), str(root), recursive=recursive)
+    observer.start()
+    return observer
+
+# Function to keep .py and .ipynb files in sync as they are saved
+def watch(direction="both", root=None, recursive=False, include=None, exclude=None,
+          debounce=WATCH_DEBOUNCE, duration=None):
+    """
+    Convert each .py/.ipynb file as soon as it is saved.
+
+    Filesystem events come from watchdog when it is installed; otherwise the
+    folder is rescanned every WATCH_POLL_INTERVAL seconds. A burst of events
+    for one file is collapsed into a single conversion once the file has
+    been quiet for `debounce` seconds, and only that file is converted.
+    Quiet time counts from the change itself (the event time, or the file's
+    mtime when polling), not from when it was noticed, so polling adds at
+    most one WATCH_POLL_INTERVAL to the save → conversion latency.
+    The (size, mtime) of every output written here is remembered, so the
+    event caused by writing B from A is recognized and does not convert B
+    back into A. A conversion that fails leaves its output untouched and is
+    not retried until the source changes again. The tool's own modules
+    (TOOL_FILES) are never converted, and sources are never moved to the
+    backup store.
+
+    Args:
+        direction (str): 'py' for py→ipynb, 'ipynb' for ipynb→py, or
+            'both' to sync in both directions.
+        root (Path): Folder to watch (defaults to CURRENT_DIR).
+        recursive (bool): Also watch subfolders.
+        include (list): fnmatch patterns of relative paths to convert.
+        exclude (list): fnmatch patterns of relative paths or folders to skip.
+        debounce (float): Seconds of quiet before a changed file is converted.
+        duration (float): Stop after this many seconds (None runs until Ctrl+C).
+
+    Raises:
+        ValueError: If an unsupported direction is provided.
+    """
+    converters = {".py": (py_to_ipynb_stream, ".ipynb"), ".ipynb": (ipynb_to_py_stream, ".py")}
+    if direction not in {"both", "py", "ipynb"}:
+        raise ValueError(f"Unsupported watch direction: {direction}")
+    if direction != "both":
+        converters = {f".{direction}": converters[f".{direction}"]}
+
+    root = Path(root).expanduser().resolve() if root else CURRENT_DIR.resolve()
+    events = queue.Queue()
+    observer = _start_observer(root, recursive, events)
+
+    suffixes = tuple(converters)
+    snapshot = _scan_signatures(root, suffixes, recursive) if observer is None else None
+    next_scan = time.monotonic() + WATCH_POLL_INTERVAL
+    stop_at = None if duration is None else time.monotonic() + duration
+    due = {}  # Source path → time it has been quiet long enough
+    written = {}  # Path → signature when this process last wrote or converted it
+
+    def handle(path):
+        signature = _stat_signature(path)
+        if signature is None or written.get(path) == signature:
+            # Deleted, our own output, or already converted (or failed) in this state
+            return
+
+        convert_fn, dest_suffix = converters[path.suffix]
+        output_path = path.with_suffix(dest_suffix)
+        start = time.perf_counter()
+        try:
+            with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+                convert_fn(path, output_path)
+        except Exception as e:
+            # The output was left untouched; wait for the next save to retry
+            written[path] = signature
+            print(f"❌ {path.relative_to(root)}: {type(e).__name__}: {e}")
+            return
+        written[path] = signature
+        written[output_path] = _stat_signature(output_path)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"🔄 {path.relative_to(root)} → {output_path.name} ({elapsed:.0f} ms)")
+
+    mode = "watchdog events" if observer is not None else f"polling every {WATCH_POLL_INTERVAL}s"
+    print(f"\n👀 Watching {root} for {', '.join(converters)} changes ({mode}, Ctrl+C to stop)")
+
+    try:
+        while stop_at is None or time.monotonic() < stop_at:
+            now = time.monotonic()
+            deadlines = list(due.values())
+            if observer is None:
+                deadlines.append(next_scan)
+            if stop_at is not None:
+                deadlines.append(stop_at)
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+
+            # Block until the next event or deadline, then drain the queue
+            changed = []  # (path, monotonic time of the change)
+            try:
+                changed.append(events.get(timeout=timeout))
+                while True:
+                    changed.append(events.get_nowait())
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            if observer is None and now >= next_scan:
+                current = _scan_signatures(root, suffixes, recursive)
+                scanned_at = time.monotonic()
+                clock_offset = time.time() - scanned_at
+                changed.extend(
+                    (path, min(scanned_at, sig[1] / 1e9 - clock_offset))
+                    for path, sig in current.items() if snapshot.get(path) != sig
+                )
+                snapshot = current
+                next_scan = now + WATCH_POLL_INTERVAL
+
+            for path, changed_at in changed:
+                path = Path(path)
+                if path in TOOL_FILES:
+                    continue
+                if _watch_match(path, root, converters.keys(), recursive, include, exclude):
+                    due[path] = max(due.get(path, 0.0), changed_at + debounce)
+
+            for path in [path for path, ready_at in due.items() if ready_at <= now]:
+                del due[path]
+                handle(path)
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping watch mode")
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+# Function to run the command-line interface
+def main(argv=None):
+    """
+    Command-line entry point: `python -m convert [1|2|3|4] [options]`.
+
+    Without arguments it converts every .py file in this folder to .ipynb,
+    as running the script always did.
+
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv[1:]).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m convert",
+        description="Convert between .py scripts with '# %%' markers and .ipynb notebooks."
+    )
+    parser.add_argument("conversion", nargs="?", type=int, choices=[1, 2, 3, 4], default=2,
+                        help="1 for ipynb→py, 2 for py→ipynb, 3 for py→ipynb with the "
+                             "streaming writer, 4 for ipynb→py with the streaming reader "
+                             "(default: 2)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="worker processes, 0 for every core (default: 1)")
+    parser.add_argument("--root", help="folder to convert (default: this script's folder)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="also convert subfolders")
+    parser.add_argument("--include", action="append", help="fnmatch pattern of paths to convert")
+    parser.add_argument("--exclude", action="append", help="fnmatch pattern of paths to skip")
+    parser.add_argument("--no-cache", action="store_true", help="reconvert every file")
+    parser.add_argument("--serve", action="store_true",
+                        help="read JSON conversion jobs from stdin, one per line")
+    parser.add_argument("--watch", nargs="?", const="both", choices=["both", "py", "ipynb"],
+                        help="convert files as they are saved: py, ipynb or both (default: both)")
+    args = parser.parse_args(argv)
+
+    jobs = args.jobs or None
+    if args.serve:
+        serve(jobs)
+        return
+    if args.watch:
+        watch(args.watch, root=args.root, recursive=args.recursive, include=args.include, exclude=args.exclude)
+        return
+
+    convert_by_number(
+        args.conversion, jobs, not args.no_cache,
+        root=args.root, recursive=args.recursive, include=args.include, exclude=args.exclude
+    )
+
+    # Print confirmation message
+    print("\n✅ converter.py successfully executed")
 
-# Command center
-# Convert all .ipynb files to .py
-# convert_by_number(1)
 
-# Convert all .py files to .ipynb
-convert_by_number(2)
+# Command center (guarded so importing this module has no side effects)
+if __name__ == "__main__":
+    main()
 
-# Print confirmation message
-print("\n✅ converter.py successfully executed")
+    # Library use from another script or a long-lived worker:
+    # from convert import convert_by_number, convert_file, prune_backups
+    # convert_by_number(1, jobs=None, root="~/projects", recursive=True, exclude=["build/*"])
+    # convert_file("notebook.ipynb")
+    # watch("both", root="~/projects", recursive=True)
+    # prune_backups(keep_last=5)
@@ -1,6 +1,3 @@
-# Import third-party libraries
-from PIL import Image
-
 # Import standard libraries
 from pathlib import Path
 
@@ -62,6 +59,8 @@ Returns:
     Image.Image: Composite frame image.
 """
 def build_frame(artwork_size, frame_parts, edge_width):
+    from PIL import Image  # Imported lazily to keep module import cheap
+
     art_w, art_h = artwork_size
     new_w = art_w + 2 * edge_width
     new_h = art_h + 2 * edge_width
@@ -86,19 +85,21 @@ def build_frame(artwork_size, frame_parts, edge_width):
 
     return result
 
-# Load assets
-assets = load_assets(
-    background_path=BACKGROUND_PATH,
-    frame_path=FRAME_PATH,
-    artwork_path=ARTWORK_PATH
-)
+# Build the frame (only when run as a script)
+if __name__ == "__main__":
+    # Load assets
+    assets = load_assets(
+        background_path=BACKGROUND_PATH,
+        frame_path=FRAME_PATH,
+        artwork_path=ARTWORK_PATH
+    )
 
-# Generate frame and save output
-frame_parts = slice_frame_edges(assets["frame"], EDGE_SLICE)
-dynamic_frame = build_frame(assets["artwork"].size, frame_parts, EDGE_SLICE)
-dynamic_frame.convert("RGB").save(OUTPUT_PATH)
+    # Generate frame and save output
+    frame_parts = slice_frame_edges(assets["frame"], EDGE_SLICE)
+    dynamic_frame = build_frame(assets["artwork"].size, frame_parts, EDGE_SLICE)
+    dynamic_frame.convert("RGB").save(OUTPUT_PATH)
 
-print(f"[OK] Frame image saved to {OUTPUT_PATH}")
+    print(f"[OK] Frame image saved to {OUTPUT_PATH}")
 
-# Print confirmation message
-print("\n✅ frame_builder.py successfully executed")
+    # Print confirmation message
+    print("\n✅ frame_builder.py successfully executed")
@@ -1,6 +1,3 @@
-# Import third-party libraries
-from PIL import Image
-
 # Import standard libraries
 from pathlib import Path
 
@@ -23,6 +20,8 @@ Returns:
     Image.Image: The loaded PIL image in RGBA mode.
 """
 def load_image(path):
+    from PIL import Image  # Imported lazily to keep module import cheap
+
     if not path.exists():
         raise FileNotFoundError(f"Image not found: {path}")
     return Image.open(path).convert("RGBA")
@@ -50,19 +49,20 @@ def load_assets(background_path, frame_path, artwork_path):
         "artwork": artwork
     }
 
-# Load and preview assets
-assets = load_assets(
-    background_path=BACKGROUND_PATH,
-    frame_path=FRAME_PATH,
-    artwork_path=ARTWORK_PATH
-)
+# Load and preview assets (only when run as a script)
+if __name__ == "__main__":
+    assets = load_assets(
+        background_path=BACKGROUND_PATH,
+        frame_path=FRAME_PATH,
+        artwork_path=ARTWORK_PATH
+    )
 
-assets["background"].show(title="Background")
-assets["frame"].show(title="Frame")
-assets["artwork"].show(title="Artwork")
+    assets["background"].show(title="Background")
+    assets["frame"].show(title="Frame")
+    assets["artwork"].show(title="Artwork")
 
-for name, img in assets.items():
-    print(f"{name}: {img.size}, {img.mode}")
+    for name, img in assets.items():
+        print(f"{name}: {img.size}, {img.mode}")
 
-# Print confirmation message
-print("\n✅ asset_loader.py successfully executed")
+    # Print confirmation message
+    print("\n✅ asset_loader.py successfully executed")
@@ -0,0 +1,214 @@
+# Import standard libraries
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import contextlib
+from pathlib import Path
+from datetime import datetime, timezone
+
+# Import project-specific modules
+import generate
+
+
+# Define benchmark constants
+CONTACT_COUNT = 1_000_000  # Contacts in the synthetic extract
+MAX_PHONES = 3  # Phone lines per contact (1..MAX_PHONES)
+DUPLICATE_RATIO = 0.2  # Share of contacts that repeat an earlier one, reformatted
+SEED = 42
+
+
+# Function to write a synthetic extract.txt
+def generate_extract(txt_path, count=CONTACT_COUNT):
+    """
+    Write a synthetic OCR extract with one name line and 1..MAX_PHONES
+    phone lines per contact.
+
+    Args:
+        txt_path (Path): Destination text file.
+        count (int): Number of contacts to write.
+    """
+    rng = random.Random(SEED)
+    with open(txt_path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            lines = [f"Contact {i}\n"]
+            for _ in range(rng.randint(1, MAX_PHONES)):
+                lines.append(f"+1 {rng.randint(200, 999)} {rng.randint(200, 999)} {rng.randint(0, 9999):04d}\n")
+            f.write("".join(lines))
+
+
+# Function to build synthetic contacts with reformatted duplicates
+def generate_contacts(count=CONTACT_COUNT, duplicate_ratio=DUPLICATE_RATIO):
+    """
+    Build contacts where `duplicate_ratio` of them repeat an earlier contact
+    with differently formatted numbers, sometimes plus a new number.
+    Duplicates are only made from original contacts, whose numbers are all
+    in the '+1 555 123 4567' form the reformatting slices.
+
+    Args:
+        count (int): Number of contacts to build.
+        duplicate_ratio (float): Share of contacts that are duplicates.
+
+    Returns:
+        list: Contact records.
+    """
+    rng = random.Random(SEED)
+    contacts = []
+    originals = []
+    for i in range(count):
+        if originals and rng.random() < duplicate_ratio:
+            original = originals[rng.randrange(len(originals))]
+            # Same number written as '+1 (555) 123-4567' instead of '+1 555 123 4567'
+            phones = [f"{p[:2]} ({p[3:6]}) {p[7:10]}-{p[11:]}" for p in original.phones]
+            if rng.random() < 0.3:
+                phones.append(f"+1 {rng.randint(200, 999)} {rng.randint(200, 999)} {rng.randint(0, 9999):04d}")
+            contacts.append(generate.Contact("X", original.last_name, phones))
+            continue
+        phones = [
+            f"+1 {rng.randint(200, 999)} {rng.randint(200, 999)} {rng.randint(0, 9999):04d}"
+            for _ in range(rng.randint(1, MAX_PHONES))
+        ]
+        originals.append(generate.Contact("X", f"Contact {i}", phones))
+        contacts.append(originals[-1])
+    return contacts
+
+
+# Function to time the merge stage at growing input sizes
+def run_merge_benchmark(count=CONTACT_COUNT, duplicate_ratio=DUPLICATE_RATIO):
+    """
+    Time ContactMerger on a quarter, half and all of `count` contacts;
+    the per-contact rate should stay flat if merging is linear.
+
+    Args:
+        count (int): Largest number of contacts to merge.
+        duplicate_ratio (float): Share of contacts that are duplicates.
+    """
+    print(f"\n🧪 Generating {count:,} synthetic contacts ({duplicate_ratio:.0%} duplicates)...")
+    contacts = generate_contacts(count, duplicate_ratio)
+
+    for size in (count // 4, count // 2, count):
+        merger = generate.ContactMerger()
+        start = time.perf_counter()
+        for contact in contacts[:size]:
+            merger.add(contact)
+        elapsed = time.perf_counter() - start
+        stats = merger.stats
+        print(f"⏱️ merge {size:>9,} contacts  {elapsed:6.2f} s  {size / elapsed:>10,.0f} /s  "
+              f"→ {stats['contacts_out']:,} ({stats['merged']:,} merged, "
+              f"{stats['duplicate_phones']:,} repeated numbers)")
+
+
+# Function reproducing the previous list-based generator
+def generate_legacy(txt_path, vcf_path):
+    """
+    Previous implementation: load every line and contact, then write each
+    vCard line by line with a REV timestamp per contact.
+
+    Args:
+        txt_path (Path): Extract to read.
+        vcf_path (Path): VCF file to write.
+
+    Returns:
+        int: Number of vCards written.
+    """
+    with open(txt_path, "r", encoding="utf-8") as file:
+        lines = [line.strip() for line in file if line.strip()]
+
+    contacts = []
+    current_contact = {"first_name": "X", "last_name": "", "phones": []}
+    for line in lines:
+        if line[0].isalpha():
+            if current_contact["last_name"] and current_contact["phones"]:
+                contacts.append(current_contact)
+            current_contact = {"first_name": "X", "last_name": line, "phones": []}
+        else:
+            current_contact["phones"].append(line)
+    if current_contact["last_name"] and current_contact["phones"]:
+        contacts.append(current_contact)
+
+    with open(vcf_path, "w", encoding="utf-8") as vcf_file:
+        for contact in contacts:
+            rev_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            vcf_file.write("BEGIN:VCARD\n")
+            vcf_file.write("VERSION:3.0\n")
+            vcf_file.write("PRODID:-//Apple Inc.//iOS 18.3.1//EN\n")
+            vcf_file.write(f"N:;{contact['last_name']};;;\n")
+            vcf_file.write(f"FN:{contact['first_name']} {contact['last_name']}\n")
+            vcf_file.write(f"TEL;TYPE=CELL;TYPE=VOICE;TYPE=pref:{contact['phones'][0]}\n")
+            for i, phone in enumerate(contact["phones"][1:], start=1):
+                vcf_file.write(f"item{i}.TEL;type=pref:{phone}\n")
+            vcf_file.write(f"REV:{rev_time}\n")
+            vcf_file.write("END:VCARD\n\n")
+
+    return len(contacts)
+
+
+# Function to generate through the streaming pipeline
+def generate_streaming(txt_path, vcf_path):
+    """
+    Current implementation: single streaming pass.
+
+    Args:
+        txt_path (Path): Extract to read.
+        vcf_path (Path): VCF file to write.
+
+    Returns:
+        int: Number of vCards written.
+    """
+    return generate.write_vcards(generate.iter_contacts(generate.iter_lines(txt_path)), vcf_path)
+
+
+# Function to time a generator and measure its peak memory
+def _time_run(label, generate_fn, txt_path, vcf_path):
+    """
+    Run a generator twice: once for wall time, once under tracemalloc for
+    peak Python memory, and print both.
+
+    Args:
+        label (str): Name printed next to the result.
+        generate_fn (function): Callable taking (txt_path, vcf_path).
+        txt_path (Path): Extract to read.
+        vcf_path (Path): VCF file to write.
+    """
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        start = time.perf_counter()
+        count = generate_fn(txt_path, vcf_path)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        generate_fn(txt_path, vcf_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"⏱️ {label:<10} {count:>9} vCards  {elapsed:7.2f} s  {count / elapsed:>10,.0f} /s  peak {peak / (1 << 20):8.1f} MiB")
+
+
+# Function to compare the legacy and streaming generators
+def run_benchmark(count=CONTACT_COUNT):
+    """
+    Compare VCF generation time and peak memory on a synthetic extract.
+
+    Args:
+        count (int): Number of contacts in the synthetic extract.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        txt_path = Path(tmp) / "extract.txt"
+        print(f"\n🧪 Generating synthetic extract with {count:,} contacts...")
+        generate_extract(txt_path, count)
+        print(f"📄 {txt_path.stat().st_size / (1 << 20):.0f} MB extract")
+
+        _time_run("legacy", generate_legacy, txt_path, Path(tmp) / "legacy.vcf")
+        _time_run("streaming", generate_streaming, txt_path, Path(tmp) / "streaming.vcf")
+
+
+# Command center
+if __name__ == "__main__":
+    run_benchmark()
+    run_merge_benchmark()
+
+    # Quick run on a small extract
+    # run_benchmark(count=10_000)
+    # run_merge_benchmark(count=10_000)
+
+    print("\n✅ benchmark.py successfully executed")
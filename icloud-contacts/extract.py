@@ -1,41 +1,362 @@
 # Import standard libraries
 import os  # Used for handling file paths
+import json
+import hashlib
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 # Import third-party libraries
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+# Define constants
+PAGE_BATCH_SIZE = 4   # Pages rasterized at once by one worker
+OCR_DPI = 200         # Rasterization resolution (pdf2image default)
+TESSERACT_CONFIG = ""  # Extra tesseract options, e.g. "--psm 6"
+OCR_CACHE_DIR = Path(__file__).parent / ".ocr_cache"
+OCR_CACHE_VERSION = 1  # Bump to invalidate cached OCR text
+
+
+# Function to hash a file's content
+def _file_digest(path):
+    """
+    Compute the SHA-256 of a file's content.
+
+    Args:
+        path (str): File to hash.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Function to build a cache key from OCR inputs
+def _ocr_key(*parts):
+    """
+    Hash OCR inputs (content digest, DPI, tesseract config) into a key.
+
+    Args:
+        *parts: Values that fully determine the OCR text.
+
+    Returns:
+        str: Hex key.
+    """
+    return hashlib.sha256(repr((OCR_CACHE_VERSION,) + parts).encode()).hexdigest()
+
+
+# Function to read a cached page text
+def _read_cached_page(cache_dir, page_key):
+    """
+    Read the OCR text stored for a page key.
+
+    Args:
+        cache_dir (Path): OCR cache directory.
+        page_key (str): Key of the page image.
+
+    Returns:
+        str: Cached text, or None if the page is not cached.
+    """
+    try:
+        with open(cache_dir / "pages" / f"{page_key}.txt", "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+# Function to atomically write a cache file
+def _write_cache_file(path, text):
+    """
+    Write text to a temporary file and move it into place.
+
+    Args:
+        path (Path): Final cache file path.
+        text (str): Content to store.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+# Function to rasterize and OCR one range of pages
+def _ocr_batch(pdf_path, first_page, last_page, dpi, config, cache_dir=None):
+    """
+    Rasterize a page range and run OCR on each page.
+
+    Runs inside a worker process; only the page images of this batch are
+    held in memory, and only their text is sent back. With a cache, each
+    rendered page is hashed and OCR is skipped for any page image seen
+    before (e.g. unchanged pages of an edited PDF).
+
+    Args:
+        pdf_path (str): The file path of the input PDF.
+        first_page (int): First page of the batch (1-based).
+        last_page (int): Last page of the batch (inclusive).
+        dpi (int): Rasterization resolution.
+        config (str): Extra tesseract options.
+        cache_dir (Path): OCR cache directory (None disables the cache).
+
+    Returns:
+        list: (page key or None, OCR text) of each page, in page order.
+    """
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=first_page, last_page=last_page)
+    results = []
+    for img in images:
+        if cache_dir is None:
+            results.append((None, pytesseract.image_to_string(img, config=config)))
+            continue
+
+        image_digest = hashlib.sha256(img.tobytes()).hexdigest()
+        page_key = _ocr_key(image_digest, img.mode, img.size, dpi, config)
+        text = _read_cached_page(cache_dir, page_key)
+        if text is None:
+            text = pytesseract.image_to_string(img, config=config)
+            _write_cache_file(cache_dir / "pages" / f"{page_key}.txt", text)
+        results.append((page_key, text))
+    return results
+
+
+# Function to split a document into page ranges
+def _page_batches(pages, batch_size):
+    """
+    Split a sorted list of page numbers into runs of consecutive pages.
+
+    Args:
+        pages (list): Page numbers (1-based), in ascending order.
+        batch_size (int): Maximum pages per range.
+
+    Returns:
+        list: (first_page, last_page) tuples.
+    """
+    batches = []
+    for page in pages:
+        if batches and page == batches[-1][1] + 1 and page - batches[-1][0] < batch_size:
+            batches[-1] = (batches[-1][0], page)
+        else:
+            batches.append((page, page))
+    return batches
+
+
+# Function to load the page keys recorded for a PDF
+def _load_document_index(cache_dir, document_key):
+    """
+    Load the page → page key map stored for one PDF, DPI and config.
+
+    Args:
+        cache_dir (Path): OCR cache directory.
+        document_key (str): Key of the PDF content, DPI and config.
+
+    Returns:
+        dict: Page number (str) → page key.
+    """
+    try:
+        with open(cache_dir / "documents" / f"{document_key}.json", "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+# Function to look up the pages of a PDF already in the OCR cache
+def _load_cached_pages(pdf_path, page_count, dpi, config, cache_dir):
+    """
+    Read the cached text of every page OCRed before for this exact PDF,
+    DPI and tesseract config.
+
+    Args:
+        pdf_path (str): The file path of the input PDF.
+        page_count (int): Number of pages in the PDF.
+        dpi (int): Rasterization resolution.
+        config (str): Extra tesseract options.
+        cache_dir (Path): OCR cache directory (None disables the cache).
+
+    Returns:
+        tuple: (document key, document index, {page: text}); the key and
+            index are None when the cache is disabled.
+    """
+    if cache_dir is None:
+        return None, None, {}
+
+    document_key = _ocr_key(_file_digest(pdf_path), dpi, config)
+    document_index = _load_document_index(cache_dir, document_key)
+    cached = {}
+    for page in range(1, page_count + 1):
+        page_key = document_index.get(str(page))
+        text = _read_cached_page(cache_dir, page_key) if page_key else None
+        if text is not None:
+            cached[page] = text
+    return document_key, document_index, cached
+
+
+# Function to store the page keys recorded for a PDF
+def _save_document_index(cache_dir, document_key, document_index):
+    """
+    Atomically save the page → page key map of one PDF, DPI and config.
+
+    Args:
+        cache_dir (Path): OCR cache directory.
+        document_key (str): Key of the PDF content, DPI and config.
+        document_index (dict): Page number (str) → page key.
+    """
+    _write_cache_file(cache_dir / "documents" / f"{document_key}.json", json.dumps(document_index))
+
+
+# Writer that puts OCR results into a text file in page order
+class _PageWriter:
+    """
+    Writes page texts in page order, whatever order batches finish in.
+
+    Finished batches wait until every earlier batch is written; cached
+    pages between batches are written in their place. Page keys of newly
+    OCRed pages are recorded in the document index.
+
+    Args:
+        text_file (file): Output text file open for writing.
+        page_count (int): Number of pages in the PDF.
+        batches (list): (first_page, last_page) ranges being OCRed.
+        cached (dict): Page → cached text for pages not in any batch.
+        document_index (dict): Page → page key map to update, or None.
+    """
+
+    def __init__(self, text_file, page_count, batches, cached, document_index=None):
+        self.page_count = page_count
+        self.next_page = 1
+        self._file = text_file
+        self._firsts = deque(first for first, _ in batches)
+        self._ready = {}
+        self._cached = cached
+        self._document_index = document_index
+
+    @property
+    def done(self):
+        """bool: True once every page has been written."""
+        return self.next_page > self.page_count
+
+    def add(self, first_page, results):
+        """
+        Accept the results of one batch and write everything now in order.
+
+        Args:
+            first_page (int): First page of the batch (None when every
+                page is cached and only cached pages are left to write).
+            results (list): (page key or None, text) per page of the batch.
+
+        Returns:
+            int: Number of pages written so far.
+        """
+        if first_page is not None:
+            self._ready[first_page] = results
+        while self._firsts and self._firsts[0] in self._ready:
+            first = self._firsts.popleft()
+            self._write_cached(first)
+            for page_key, text in self._ready.pop(first):
+                self._write_page(page_key, text)
+        if not self._firsts:
+            # Trailing cached pages
+            self._write_cached(self.page_count + 1)
+        self._file.flush()
+        return self.next_page - 1
+
+    def _write_cached(self, until_page):
+        while self.next_page < until_page:
+            self._write_page(None, self._cached[self.next_page])
+
+    def _write_page(self, page_key, text):
+        # Pages are joined with a newline, as before
+        if self.next_page > 1:
+            self._file.write("\n")
+        self._file.write(text)
+        if page_key is not None and self._document_index is not None:
+            self._document_index[str(self.next_page)] = page_key
+        self.next_page += 1
 
 
 # Function to extract text from a PDF using OCR
-def extract_text(pdf_path):
+def extract_text(pdf_path, workers=None, batch_size=PAGE_BATCH_SIZE, dpi=OCR_DPI,
+                 config=TESSERACT_CONFIG, cache_dir=OCR_CACHE_DIR, text_path=None):
     """
     Extract text from a PDF file using OCR and save it to 'extract.txt'.
 
     Steps:
-    1. Convert PDF pages to images using pdf2image.
-    2. Apply Tesseract OCR on each image.
-    3. Save extracted text to 'extract.txt' in the same directory.
+    1. Look up every page in the OCR cache by PDF hash, page number, DPI
+       and tesseract config; cached pages are not rasterized at all.
+    2. Split the remaining pages into batches of `batch_size` pages and
+       rasterize and OCR them on a process pool. Pages whose rendered
+       image was OCRed before (unchanged pages of an edited PDF) reuse
+       the cached text instead of running tesseract.
+    3. Append text to 'extract.txt' in page order as soon as all earlier
+       pages are written.
+
+    At most two batches per worker are in flight, so memory is bounded by
+    the batch size rather than the page count.
 
     Args:
         pdf_path (str): The file path of the input PDF.
+        workers (int): Worker processes (None for CPU count).
+        batch_size (int): Pages rasterized at once by one worker.
+        dpi (int): Rasterization resolution.
+        config (str): Extra tesseract options.
+        cache_dir (Path): OCR cache directory (None disables the cache).
+        text_path (str): Output text file (defaults to 'extract.txt' next
+            to the PDF).
 
     Returns:
         str: The full path to the saved extracted text file.
     """
-    pdf_dir = os.path.dirname(pdf_path)
-    text_file_path = os.path.join(pdf_dir, "extract.txt")
+    text_file_path = text_path or os.path.join(os.path.dirname(pdf_path), "extract.txt")
+    page_count = pdfinfo_from_path(pdf_path)["Pages"]
 
-    print("🔄 Converting PDF to images...")
-    images = convert_from_path(pdf_path)
+    # Pages already OCRed for this exact PDF, DPI and config
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    document_key, document_index, cached = _load_cached_pages(pdf_path, page_count, dpi, config, cache_dir)
 
-    print("🔍 Running OCR on extracted images...")
-    ocr_text = "\n".join(pytesseract.image_to_string(img) for img in images)
+    missing = [page for page in range(1, page_count + 1) if page not in cached]
+    batches = _page_batches(missing, batch_size)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(batches) or 1))
 
+    print(
+        f"🔍 Rasterizing {len(missing)} of {page_count} pages for OCR "
+        f"({len(batches)} batches, {workers} workers, {len(cached)} cached)..."
+    )
     with open(text_file_path, "w", encoding="utf-8") as text_file:
-        text_file.write(ocr_text)
+        writer = _PageWriter(text_file, page_count, batches, cached, document_index)
+
+        def write_pages(first_page, results):
+            written = writer.add(first_page, results)
+            print(f"📄 {written}/{page_count} pages written")
+
+        if not batches:
+            write_pages(None, [])
+        elif workers == 1:
+            for first_page, last_page in batches:
+                write_pages(first_page, _ocr_batch(pdf_path, first_page, last_page, dpi, config, cache_dir))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Futures are written in submission order, which is page order
+                pending = deque()
+                for first_page, last_page in batches:
+                    future = pool.submit(_ocr_batch, pdf_path, first_page, last_page, dpi, config, cache_dir)
+                    pending.append((first_page, future))
+                    if len(pending) >= workers * 2:
+                        first, done = pending.popleft()
+                        write_pages(first, done.result())
+                while pending:
+                    first, done = pending.popleft()
+                    write_pages(first, done.result())
+
+    if document_index is not None:
+        _save_document_index(cache_dir, document_key, document_index)
 
     print(f"✅ Extracted text saved to: {text_file_path}")
     return text_file_path
 
-# Print confirmation message
-print("\n✅ extract.py successfully executed")
+
+if __name__ == "__main__":
+    # Print confirmation message
+    print("\n✅ extract.py successfully executed")
@@ -1,63 +1,348 @@
 # Import standard libraries
 import os
-from datetime import datetime
+import re
+from datetime import datetime, timezone
 
-# Function to generate an iCloud-compatible VCF from a filtered text file
-def generate_icloud_vcf(txt_path):
-    """
-    Convert a filtered text file into an iCloud-compatible .vcf file.
+# Define constants
+WRITE_BUFFER_SIZE = 1 << 20  # Bytes buffered before each write to disk
+DEFAULT_COUNTRY_CODE = None  # e.g. "33": prefix for numbers written without one (None keeps them national)
+_NON_DIGITS = re.compile(r"\D")
+VCARD_HEADER = "BEGIN:VCARD\nVERSION:3.0\nPRODID:-//Apple Inc.//iOS 18.3.1//EN\n"
 
-    Assumes names begin with letters and phone numbers do not.
-    Each contact is separated by name and one or more phone lines.
+
+# Compact record for one parsed contact
+class Contact:
+    """
+    One contact parsed from the extracted text.
 
     Args:
-        txt_path (str): Path to the filtered extract.txt file.
+        first_name (str): Given name ('X' for OCR exports, which have none).
+        last_name (str): Name line from the extract.
+        phones (list): Phone lines, in the order they appeared.
+    """
 
-    Returns:
-        str: Path of the generated .vcf file.
+    __slots__ = ("first_name", "last_name", "phones")
+
+    def __init__(self, first_name, last_name, phones):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.phones = phones
+
+
+# Generator to read non-empty, stripped lines from a text file
+def iter_lines(txt_path):
     """
-    vcf_path = os.path.join(os.path.dirname(txt_path), "contacts.vcf")
+    Yield every non-empty line of a text file, stripped.
+
+    Args:
+        txt_path (str): Path to the text file.
 
-    print("📂 Reading extracted contacts...")
+    Yields:
+        str: Each stripped, non-empty line.
+    """
     with open(txt_path, "r", encoding="utf-8") as file:
-        lines = [line.strip() for line in file if line.strip()]
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+
 
-    contacts = []
-    current_contact = {"first_name": "X", "last_name": "", "phones": []}
+# Generator to group lines into contacts
+def iter_contacts(lines):
+    """
+    Group name and phone lines into contacts, one at a time.
+
+    Assumes names begin with letters and phone numbers do not. A contact
+    is yielded once the next name line starts, and only if it has both a
+    name and at least one phone.
+
+    Args:
+        lines (iterable): Stripped, non-empty lines.
+
+    Yields:
+        Contact: Each complete contact, in file order.
+    """
+    last_name = ""
+    phones = []
 
     for line in lines:
         if line[0].isalpha():
-            if current_contact["last_name"] and current_contact["phones"]:
-                contacts.append(current_contact)
-            current_contact = {"first_name": "X", "last_name": line, "phones": []}
+            if last_name and phones:
+                yield Contact("X", last_name, phones)
+            last_name = line
+            phones = []
         else:
-            current_contact["phones"].append(line)
+            phones.append(line)
 
-    if current_contact["last_name"] and current_contact["phones"]:
-        contacts.append(current_contact)
+    if last_name and phones:
+        yield Contact("X", last_name, phones)
 
-    print(f"📄 {len(contacts)} contacts extracted. Generating iCloud-compatible VCF...")
 
-    with open(vcf_path, "w", encoding="utf-8") as vcf_file:
-        for idx, contact in enumerate(contacts, start=1):
-            last_name = contact["last_name"]
-            rev_time = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+# Function to turn a phone line into a canonical key
+def normalize_phone(phone, default_country=DEFAULT_COUNTRY_CODE):
+    """
+    Build an E.164-style key for a phone number, so differently formatted
+    copies of one number compare equal.
+
+    Separators are dropped; '+' or an international '00' prefix keeps the
+    country code. National numbers get `default_country` (dropping a
+    leading trunk '0') when one is set, and stay bare digits otherwise.
+
+    Args:
+        phone (str): Phone line as it appears in the extract.
+        default_country (str): Country code for national numbers, or None.
+
+    Returns:
+        str: Canonical key such as '+33612345678', or None if the line
+            holds no digits.
+    """
+    digits = _NON_DIGITS.sub("", phone)
+    if not digits:
+        return None
+    if phone.lstrip().startswith("+"):
+        return f"+{digits}"
+    if digits.startswith("00"):
+        return f"+{digits[2:]}"
+    if default_country:
+        return f"+{default_country}{digits[1:] if digits.startswith('0') else digits}"
+    return digits
+
+
+# Merger that folds duplicate contacts together through a phone index
+class ContactMerger:
+    """
+    Merge contacts that share a name and a phone number, in one pass.
+
+    A hash index maps each (name, normalized phone) pair to the group that
+    owns it, so every contact costs one dictionary lookup per phone. A
+    contact whose phones belong to several groups joins them into the
+    earliest one (union-find with path compression). Merged contacts keep
+    the union of their phones, the earliest contact's first, with each
+    number written once. Differently named contacts are never merged: a
+    number they share stays on each of them and is counted in
+    'shared_phones'.
+
+    Args:
+        default_country (str): Country code for national numbers, or None.
+    """
+
+    def __init__(self, default_country=DEFAULT_COUNTRY_CODE):
+        self.default_country = default_country
+        self._owner = {}  # (name, phone key) → group index
+        self._numbers = set()  # Every phone key seen, to count shared numbers
+        self._parent = []  # Group index → parent group index
+        self._groups = []  # Group index → Contact, or None once merged away
+        self.stats = {
+            "contacts_in": 0,
+            "contacts_out": 0,
+            "merged": 0,
+            "phones_in": 0,
+            "duplicate_phones": 0,
+            "shared_phones": 0
+        }
+
+    def _find(self, group):
+        root = group
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[group] != root:
+            self._parent[group], group = root, self._parent[group]
+        return root
+
+    def _own(self, name, key, group):
+        if key not in self._numbers:
+            self._numbers.add(key)
+        else:
+            # Already held by a contact with another name, which keeps it too
+            self.stats["shared_phones"] += 1
+        self._owner[(name, key)] = group
 
-            vcf_file.write("BEGIN:VCARD\n")
-            vcf_file.write("VERSION:3.0\n")
-            vcf_file.write("PRODID:-//Apple Inc.//iOS 18.3.1//EN\n")
-            vcf_file.write(f"N:;{last_name};;;\n")
-            vcf_file.write(f"FN:{contact['first_name']} {contact['last_name']}\n")
-            vcf_file.write(f"TEL;TYPE=CELL;TYPE=VOICE;TYPE=pref:{contact['phones'][0]}\n")
+    def add(self, contact):
+        """
+        Add one contact, merging it into any same-name group sharing a phone.
 
-            for i, phone in enumerate(contact["phones"][1:], start=1):
-                vcf_file.write(f"item{i}.TEL;type=pref:{phone}\n")
+        Args:
+            contact (Contact): Parsed contact.
+        """
+        stats = self.stats
+        stats["contacts_in"] += 1
+        stats["phones_in"] += len(contact.phones)
 
-            vcf_file.write(f"REV:{rev_time}\n")
-            vcf_file.write("END:VCARD\n\n")
+        name = contact.last_name
+        owner = self._owner
+        keys = [normalize_phone(phone, self.default_country) for phone in contact.phones]
+        roots = sorted({self._find(owner[(name, key)]) for key in keys if (name, key) in owner})
 
+        if roots:
+            root = roots[0]
+            target = self._groups[root]
+            for other in roots[1:]:
+                # Fold a later group into the earliest one
+                absorbed = self._groups[other]
+                self._groups[other] = None
+                self._parent[other] = root
+                target.phones.extend(absorbed.phones)
+                stats["contacts_out"] -= 1
+            phones = []
+            for phone, key in zip(contact.phones, keys):
+                if key is not None and (name, key) in owner:
+                    stats["duplicate_phones"] += 1
+                    continue
+                phones.append(phone)
+                if key is not None:
+                    self._own(name, key, root)
+            target.phones.extend(phones)
+            stats["merged"] = stats["contacts_in"] - stats["contacts_out"]
+            return
+
+        group = len(self._groups)
+        phones = []
+        for phone, key in zip(contact.phones, keys):
+            if key is not None and owner.get((name, key)) == group:
+                stats["duplicate_phones"] += 1
+                continue
+            phones.append(phone)
+            if key is not None:
+                self._own(name, key, group)
+        self._parent.append(group)
+        self._groups.append(Contact(contact.first_name, name, phones))
+        stats["contacts_out"] += 1
+
+    def contacts(self):
+        """
+        Yield the merged contacts in order of first appearance.
+
+        Yields:
+            Contact: Each surviving contact.
+        """
+        for contact in self._groups:
+            if contact is not None:
+                yield contact
+
+
+# Generator to merge duplicate contacts before writing them
+def merge_contacts(contacts, default_country=DEFAULT_COUNTRY_CODE, report=True):
+    """
+    Merge contacts that share a name and a normalized phone number.
+
+    Unlike the rest of the pipeline this stage has to see every contact
+    before yielding, so it holds one compact record per unique contact.
+
+    Args:
+        contacts (iterable): Contact records, e.g. from iter_contacts.
+        default_country (str): Country code for national numbers, or None.
+        report (bool): Print merge statistics.
+
+    Yields:
+        Contact: Each merged contact, in order of first appearance.
+    """
+    merger = ContactMerger(default_country)
+    for contact in contacts:
+        merger.add(contact)
+    if report:
+        print_merge_stats(merger.stats)
+    yield from merger.contacts()
+
+
+# Function to print merge statistics
+def print_merge_stats(stats):
+    """
+    Print the counters collected by a ContactMerger.
+
+    Args:
+        stats (dict): ContactMerger.stats.
+    """
+    print(
+        f"🔗 {stats['contacts_in']} contacts → {stats['contacts_out']} after merging "
+        f"{stats['merged']} duplicates ({stats['duplicate_phones']} repeated numbers dropped, "
+        f"{stats['shared_phones']} numbers shared by differently named contacts kept apart)"
+    )
+
+
+# Function to render one contact as a vCard
+def format_vcard(contact, rev_time):
+    """
+    Render a contact as an iCloud-compatible vCard 3.0 string.
+
+    Args:
+        contact (Contact): Contact to render.
+        rev_time (str): REV timestamp shared by the whole export.
+
+    Returns:
+        str: The complete vCard, followed by a blank line.
+    """
+    phones = contact.phones
+    parts = [
+        VCARD_HEADER,
+        f"N:;{contact.last_name};;;\n",
+        f"FN:{contact.first_name} {contact.last_name}\n",
+        f"TEL;TYPE=CELL;TYPE=VOICE;TYPE=pref:{phones[0]}\n"
+    ]
+    for i in range(1, len(phones)):
+        parts.append(f"item{i}.TEL;type=pref:{phones[i]}\n")
+    parts.append(f"REV:{rev_time}\nEND:VCARD\n\n")
+    return "".join(parts)
+
+
+# Function to stream contacts into a VCF file
+def write_vcards(contacts, vcf_path, rev_time=None):
+    """
+    Write contacts to a VCF file as they are produced.
+
+    Only one contact is held at a time; output goes through a large write
+    buffer, so memory stays constant in the number of contacts.
+
+    Args:
+        contacts (iterable): Contact records, e.g. from iter_contacts.
+        vcf_path (str): Destination .vcf file.
+        rev_time (str): REV timestamp (None for the current UTC time).
+
+    Returns:
+        int: Number of vCards written.
+    """
+    if rev_time is None:
+        rev_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    count = 0
+    with open(vcf_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as vcf_file:
+        write = vcf_file.write
+        for contact in contacts:
+            write(format_vcard(contact, rev_time))
+            count += 1
+    return count
+
+
+# Function to generate an iCloud-compatible VCF from a filtered text file
+def generate_icloud_vcf(txt_path, merge=False):
+    """
+    Convert a filtered text file into an iCloud-compatible .vcf file.
+
+    Assumes names begin with letters and phone numbers do not.
+    Each contact is separated by name and one or more phone lines.
+    Lines are parsed and written in a single streaming pass, in constant
+    memory; the optional merge stage in between keeps one compact record
+    per unique contact.
+
+    Args:
+        txt_path (str): Path to the filtered extract.txt file.
+        merge (bool): Merge contacts sharing a name and a phone number.
+
+    Returns:
+        str: Path of the generated .vcf file.
+    """
+    vcf_path = os.path.join(os.path.dirname(txt_path), "contacts.vcf")
+
+    print("📂 Reading extracted contacts and generating iCloud-compatible VCF...")
+    contacts = iter_contacts(iter_lines(txt_path))
+    if merge:
+        contacts = merge_contacts(contacts)
+    count = write_vcards(contacts, vcf_path)
+
+    print(f"📄 {count} contacts written.")
     print(f"✅ iCloud-compatible VCF file created: {vcf_path}")
     return vcf_path
 
-# Print confirmation message
-print("\n✅ generate.py successfully executed")
+
+if __name__ == "__main__":
+    # Print confirmation message
+    print("\n✅ generate.py successfully executed")
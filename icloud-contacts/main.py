@@ -1,18 +1,38 @@
+# Import standard libraries
+import argparse
+
 # Project-specific imports
 from extract import extract_text
 from generate import generate_icloud_vcf
+from pipeline import import_contacts
+
+
+# The guard keeps OCR worker processes from re-running the pipeline on import
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract contacts from PDFs and generate iCloud VCF files.")
+    parser.add_argument("--import", dest="source", metavar="SOURCE",
+                        help="import a folder or glob of PDFs into output/ instead of input/contacts.pdf")
+    parser.add_argument("--merge", action="store_true", help="with --import, write one merged contacts.vcf")
+    parser.add_argument("--dedupe", action="store_true", help="merge contacts sharing a name and a phone number")
+    args = parser.parse_args()
 
+    if args.source:
+        # Import many PDFs concurrently: one .txt and .vcf per PDF in output/
+        import_contacts(args.source, merge=args.merge, dedupe=args.dedupe)
+    else:
+        # Run full pipeline on a single PDF
+        extract_path = extract_text("input/contacts.pdf")
+        generate_icloud_vcf(extract_path, merge=args.dedupe)
 
-# Run full pipeline on a single PDF
-extract_path = extract_text("input/contacts.pdf")
-generate_icloud_vcf(extract_path)
+    # Run OCR on four workers, eight pages per batch
+    # extract_path = extract_text("input/contacts.pdf", workers=4, batch_size=8)
 
-# Run only OCR extraction
-# extract_path = extract_text("input/contacts.pdf")
+    # Run only OCR extraction
+    # extract_path = extract_text("input/contacts.pdf")
 
-# Run only VCF generation (assumes extract.txt exists)
-# generate_icloud_vcf("input/extract.txt")
+    # Run only VCF generation (assumes extract.txt exists)
+    # generate_icloud_vcf("input/extract.txt")
 
 
-# Print confirmation message
-print("\n✅ main.py successfully executed")
+    # Print confirmation message
+    print("\n✅ main.py successfully executed")
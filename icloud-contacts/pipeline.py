@@ -0,0 +1,317 @@
+# Import standard libraries
+import os
+import glob
+import asyncio
+from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+
+# Import third-party libraries
+from pdf2image import pdfinfo_from_path
+
+# Project-specific imports
+from extract import (
+    _ocr_batch, _page_batches, _load_cached_pages, _save_document_index, _PageWriter,
+    PAGE_BATCH_SIZE, OCR_DPI, TESSERACT_CONFIG, OCR_CACHE_DIR
+)
+from generate import (
+    iter_lines, iter_contacts, merge_contacts, print_merge_stats, format_vcard, write_vcards,
+    ContactMerger, WRITE_BUFFER_SIZE
+)
+
+# Define constants
+OUTPUT_DIR = Path(__file__).parent / "output"
+MERGED_VCF_NAME = "contacts.vcf"
+VCF_QUEUE_SIZE = 4  # Finished extracts waiting for VCF generation
+
+
+# One PDF moving through the pipeline
+class _PdfJob:
+    """
+    Pages, cache state and output text file of one PDF.
+
+    Args:
+        pdf_path (Path): The input PDF.
+        text_path (Path): Where its extracted text is written.
+        batch_size (int): Pages rasterized at once by one worker.
+        dpi (int): Rasterization resolution.
+        config (str): Extra tesseract options.
+        cache_dir (Path): OCR cache directory (None disables the cache).
+    """
+
+    def __init__(self, pdf_path, text_path, batch_size, dpi, config, cache_dir):
+        self.pdf_path = pdf_path
+        self.text_path = text_path
+        self.error = None
+        self.page_count = pdfinfo_from_path(str(pdf_path))["Pages"]
+        self._cache_dir = cache_dir
+        self._document_key, self._document_index, cached = _load_cached_pages(
+            str(pdf_path), self.page_count, dpi, config, cache_dir
+        )
+        missing = [page for page in range(1, self.page_count + 1) if page not in cached]
+        self.batches = _page_batches(missing, batch_size)
+        self.cached_pages = len(cached)
+        self._text_file = open(text_path, "w", encoding="utf-8")
+        self.writer = _PageWriter(self._text_file, self.page_count, self.batches, cached, self._document_index)
+
+    def close(self):
+        """Close the text file and record new page keys in the cache."""
+        self._text_file.close()
+        if self.error is None and self._document_index is not None:
+            _save_document_index(self._cache_dir, self._document_key, self._document_index)
+
+
+# Function to resolve a folder or glob into PDF paths
+def find_pdfs(source):
+    """
+    List the PDFs to import.
+
+    Args:
+        source (str): A folder (its *.pdf files) or a glob pattern such as
+            'exports/**/*.pdf'.
+
+    Returns:
+        list: Sorted PDF paths.
+    """
+    source_path = Path(source).expanduser()
+    if source_path.is_dir():
+        return sorted(p for p in source_path.iterdir() if p.suffix.lower() == ".pdf" and p.is_file())
+    return sorted(Path(p) for p in glob.glob(os.path.expanduser(str(source)), recursive=True)
+                  if p.lower().endswith(".pdf"))
+
+
+# Function to give every PDF a unique output name
+def _output_stems(pdf_paths):
+    """
+    Map each PDF to a file stem that is unique within the output folder.
+
+    Args:
+        pdf_paths (list): Input PDFs.
+
+    Returns:
+        dict: PDF path → output stem.
+    """
+    stems = {}
+    used = set()
+    for pdf_path in pdf_paths:
+        stem = pdf_path.stem
+        n = 2
+        while stem in used or stem == Path(MERGED_VCF_NAME).stem:
+            stem = f"{pdf_path.stem}_{n}"
+            n += 1
+        used.add(stem)
+        stems[pdf_path] = stem
+    return stems
+
+
+# Function to turn one extract into vCards
+def _write_job_vcf(job, output_dir, stem, merged_file, merger, rev_time, dedupe):
+    """
+    Parse a finished extract and route its contacts: into the shared
+    merger, to the shared merged file, or to the PDF's own .vcf file.
+
+    Args:
+        job (_PdfJob): PDF whose text file is complete.
+        output_dir (Path): Folder for per-PDF outputs.
+        stem (str): Output file stem of this PDF.
+        merged_file (file): Open merged VCF, or None.
+        merger (ContactMerger): Merger collecting every PDF, or None.
+        rev_time (str): REV timestamp shared by the whole import.
+        dedupe (bool): Merge duplicates within a per-PDF .vcf file.
+
+    Returns:
+        int: Number of contacts parsed (merger) or vCards written.
+    """
+    contacts = iter_contacts(iter_lines(job.text_path))
+    if merger is not None:
+        count = 0
+        for contact in contacts:
+            merger.add(contact)
+            count += 1
+        return count
+    if merged_file is None:
+        if dedupe:
+            contacts = merge_contacts(contacts)
+        return write_vcards(contacts, output_dir / f"{stem}.vcf", rev_time)
+
+    count = 0
+    for contact in contacts:
+        merged_file.write(format_vcard(contact, rev_time))
+        count += 1
+    return count
+
+
+# Coroutine running every stage concurrently
+async def _run_pipeline(pdf_paths, output_dir, merge, dedupe, workers, batch_size, dpi, config, cache_dir):
+    """
+    Run open → rasterize+OCR → parse+VCF as concurrent stages.
+
+    Stages are connected by bounded asyncio queues: the producer blocks
+    once `workers * 2` page batches are waiting, and OCR workers block once
+    VCF_QUEUE_SIZE finished extracts are waiting, so a slow stage throttles
+    the ones before it. Rasterization and OCR of a batch run together in a
+    worker process, so page images never cross process boundaries. With
+    `merge` and `dedupe`, contacts of every PDF go through one merger and
+    the merged file is written once the last PDF is parsed.
+
+    Returns:
+        tuple: (failures dict, pages OCRed or cached, contacts written).
+    """
+    loop = asyncio.get_running_loop()
+    batch_queue = asyncio.Queue(maxsize=workers * 2)
+    extract_queue = asyncio.Queue(maxsize=VCF_QUEUE_SIZE)
+    stems = _output_stems(pdf_paths)
+    rev_time = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    failures = {}
+    totals = {"pages": 0, "contacts": 0}
+
+    def fail(job, error):
+        if job.error is None:
+            job.error = error
+            failures[job.pdf_path] = error
+            job.close()
+
+    async def finish(job):
+        job.close()
+        totals["pages"] += job.page_count
+        await extract_queue.put(job)
+
+    async def write(job, first_page, results):
+        # A batch the writer rejects fails its own PDF, like an OCR error
+        try:
+            job.writer.add(first_page, results)
+        except Exception as e:
+            fail(job, f"{type(e).__name__}: {e}")
+            return
+        if job.writer.done:
+            await finish(job)
+
+    async def produce():
+        for pdf_path in pdf_paths:
+            try:
+                job = await loop.run_in_executor(
+                    None, _PdfJob, pdf_path, output_dir / f"{stems[pdf_path]}.txt",
+                    batch_size, dpi, config, cache_dir
+                )
+            except Exception as e:
+                failures[pdf_path] = f"{type(e).__name__}: {e}"
+                continue
+
+            print(f"📂 {pdf_path.name}: {job.page_count} pages ({job.cached_pages} cached)")
+            if not job.batches:
+                await write(job, None, [])
+            for first_page, last_page in job.batches:
+                await batch_queue.put((job, first_page, last_page))
+
+        for _ in range(workers):
+            await batch_queue.put(None)
+
+    async def ocr_worker(pool):
+        while (item := await batch_queue.get()) is not None:
+            job, first_page, last_page = item
+            if job.error is not None:
+                continue
+            try:
+                results = await loop.run_in_executor(
+                    pool, _ocr_batch, str(job.pdf_path), first_page, last_page, dpi, config, cache_dir
+                )
+            except Exception as e:
+                fail(job, f"{type(e).__name__}: {e}")
+                continue
+            if job.error is None:
+                await write(job, first_page, results)
+
+    async def vcf_stage():
+        merged_file = merger = None
+        if merge and dedupe:
+            merger = ContactMerger()
+        elif merge:
+            merged_file = open(output_dir / MERGED_VCF_NAME, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+        try:
+            while (job := await extract_queue.get()) is not None:
+                stem = stems[job.pdf_path]
+                try:
+                    count = await loop.run_in_executor(
+                        None, _write_job_vcf, job, output_dir, stem, merged_file, merger, rev_time, dedupe
+                    )
+                except Exception as e:
+                    failures[job.pdf_path] = f"{type(e).__name__}: {e}"
+                    continue
+                totals["contacts"] += count
+                print(f"📄 {job.pdf_path.name}: {count} contacts")
+        finally:
+            if merged_file is not None:
+                merged_file.close()
+
+        if merger is not None:
+            print_merge_stats(merger.stats)
+            totals["contacts"] = await loop.run_in_executor(
+                None, write_vcards, merger.contacts(), output_dir / MERGED_VCF_NAME, rev_time
+            )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        vcf_task = asyncio.create_task(vcf_stage())
+        try:
+            await asyncio.gather(produce(), *(ocr_worker(pool) for _ in range(workers)))
+        finally:
+            await extract_queue.put(None)
+            await vcf_task
+
+    return failures, totals["pages"], totals["contacts"]
+
+
+# Function to import contacts from many PDFs at once
+def import_contacts(source, output_dir=OUTPUT_DIR, merge=False, dedupe=False, workers=None,
+                    batch_size=PAGE_BATCH_SIZE, dpi=OCR_DPI, config=TESSERACT_CONFIG, cache_dir=OCR_CACHE_DIR):
+    """
+    OCR a folder or glob of contact PDFs and generate iCloud VCF files.
+
+    Page batches from every PDF share one OCR process pool, so all cores
+    stay busy across file boundaries; parsing and VCF writing of finished
+    PDFs overlap with OCR of the next ones. Each PDF gets its own
+    '<name>.txt' in `output_dir`, plus either '<name>.vcf' or a share of
+    one merged 'contacts.vcf'. With `dedupe`, contacts sharing a name and
+    a phone number are merged (across all PDFs when `merge` is set). A
+    failing PDF does not stop the import.
+
+    Args:
+        source (str): Folder of PDFs or glob pattern.
+        output_dir (Path): Folder for extracts and VCF files.
+        merge (bool): Write one merged contacts.vcf instead of one per PDF.
+        dedupe (bool): Merge contacts that share a name and a normalized phone number.
+        workers (int): OCR worker processes (None for CPU count).
+        batch_size (int): Pages rasterized at once by one worker.
+        dpi (int): Rasterization resolution.
+        config (str): Extra tesseract options.
+        cache_dir (Path): OCR cache directory (None disables the cache).
+
+    Returns:
+        dict: PDF path → error message for every failed PDF.
+    """
+    pdf_paths = find_pdfs(source)
+    if not pdf_paths:
+        print(f"❌ No PDF files found for: {source}")
+        return {}
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    workers = workers or os.cpu_count() or 1
+
+    print(f"🚀 Importing {len(pdf_paths)} PDFs with {workers} OCR workers...")
+    failures, pages, contacts = asyncio.run(
+        _run_pipeline(pdf_paths, output_dir, merge, dedupe, workers, batch_size, dpi, config, cache_dir)
+    )
+
+    target = output_dir / MERGED_VCF_NAME if merge else output_dir
+    print(f"📊 {len(pdf_paths) - len(failures)} of {len(pdf_paths)} PDFs, {pages} pages, "
+          f"{contacts} contacts → {target}")
+    for pdf_path, error in failures.items():
+        print(f"❌ {pdf_path.name}: {error}")
+
+    return failures
+
+
+if __name__ == "__main__":
+    # Print confirmation message
+    print("\n✅ pipeline.py successfully executed")
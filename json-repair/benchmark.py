@@ -0,0 +1,118 @@
+# Import standard libraries
+import os
+import json
+import random
+import contextlib
+import tempfile
+import time
+from pathlib import Path
+
+# Import project-specific modules
+import repair
+
+
+# Define benchmark constants
+LOG_SIZE_MB = 2048  # Size of the synthetic log
+MALFORMED_RATIO = 0.01  # Share of summary blocks written truncated
+SUMMARY_EVERY = 50  # Noise lines between summary blocks
+SEED = 42
+
+
+# Function to write a synthetic training log
+def generate_log(log_path, size_mb=LOG_SIZE_MB, malformed_ratio=MALFORMED_RATIO):
+    """
+    Write a synthetic log_*.txt with interleaved noise and summary blocks.
+
+    Malformed blocks carry Python-style literals and trailing commas, so
+    they exercise the recovery tier rather than getting dropped.
+
+    Args:
+        log_path (Path): Destination log file.
+        size_mb (int): Approximate log size in megabytes.
+        malformed_ratio (float): Share of blocks written with defects.
+
+    Returns:
+        int: Number of summary blocks written.
+    """
+    rng = random.Random(SEED)
+    target = size_mb << 20
+    written = 0
+    blocks = 0
+
+    with open(log_path, "w", encoding="utf-8") as f:
+        while written < target:
+            lines = [
+                f"Epoch {rng.randint(1, 500)}/500 - loss: {rng.random():.4f} - acc: {rng.random():.4f}\n"
+                for _ in range(SUMMARY_EVERY)
+            ]
+            summary = [{
+                "model": rng.randint(1, 9),
+                "run": blocks,
+                "accuracy": rng.random(),
+                "loss": rng.random(),
+                "history": [rng.random() for _ in range(20)]
+            }]
+            block = json.dumps(summary, indent=2)
+            if rng.random() < malformed_ratio:
+                # Python-style literals and a trailing comma
+                block = block.replace('"model"', '"best": nan, "done": True, "model"')
+                block = block.replace("\n  }", ",\n  }")
+            lines.append(f"📊 Summary JSON:\n{block}\n")
+
+            chunk = "".join(lines)
+            f.write(chunk)
+            written += len(chunk.encode("utf-8"))
+            blocks += 1
+
+    return blocks
+
+
+# Function to time one extraction run
+def _time_run(label, extract, size):
+    """
+    Time an extraction callable and print its throughput.
+
+    Args:
+        label (str): Name printed next to the result.
+        extract (function): Callable returning the extracted entries.
+        size (int): Log size in bytes.
+    """
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        start = time.perf_counter()
+        count = sum(1 for _ in extract())
+        elapsed = time.perf_counter() - start
+    print(f"⏱️ {label:<24} {count:>9} entries  {elapsed:8.2f} s  {size / elapsed / (1 << 20):8.1f} MB/s")
+
+
+# Function to compare decoding backends on a synthetic log
+def run_benchmark(size_mb=LOG_SIZE_MB, malformed_ratio=MALFORMED_RATIO):
+    """
+    Compare extraction throughput across the available JSON backends.
+
+    Args:
+        size_mb (int): Approximate log size in megabytes.
+        malformed_ratio (float): Share of blocks written with defects.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "log_benchmark.txt"
+        print(f"\n🧪 Generating {size_mb} MB synthetic log...")
+        blocks = generate_log(log_path, size_mb, malformed_ratio)
+        size = log_path.stat().st_size
+        print(f"📄 {blocks} summary blocks, {size / (1 << 20):.0f} MB")
+
+        # The backend is passed explicitly so pool workers use it under any start method
+        for backend in repair.JSON_BACKENDS:
+            _time_run(f"stream [{backend}]", lambda: repair._iter_summary_from_log(log_path, backend=backend), size)
+            _time_run(f"parallel [{backend}]", lambda: repair._extract_summary_parallel(log_path, backend=backend), size)
+
+        _time_run("regex [json]", lambda: repair._extract_summary_from_log(log_path), size)
+
+
+# Command center
+if __name__ == "__main__":
+    run_benchmark()
+
+    # Quick run on a small log
+    # run_benchmark(size_mb=64)
+
+    print("\n✅ benchmark.py successfully executed")
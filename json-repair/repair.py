@@ -1,11 +1,673 @@
 # Import standard libraries
+import os
 import re
+import sys
 import json
+import mmap
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+import hashlib
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Import third-party libraries (optional fast JSON backend)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Define current directory
 CURRENT_DIR = Path(__file__).parent
+CHECKPOINT_PATH = CURRENT_DIR / ".repair_checkpoint.json"
+CHECKPOINT_WINDOW = 1 << 16  # Bytes before the offset re-hashed when a log grew
+
+# Define follow mode constants
+POLL_INTERVAL = 0.5  # Seconds between stat checks when inotify is unavailable
+FLUSH_INTERVAL = 1.0  # Longest time a parsed summary waits before it is stored
+FLUSH_MAX_ENTRIES = 1000  # Store immediately once this many summaries are waiting
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_Q_OVERFLOW = 0x4000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+# Define streaming scanner constants
+SUMMARY_MARKER = "📊 Summary JSON:".encode("utf-8")
+CHUNK_SIZE = 1 << 20  # Bytes read from the log per iteration
+MAX_BLOCK_SIZE = 64 << 20  # Abandon summary blocks that never close
+MIN_RANGE_SIZE = 8 << 20  # Smallest byte range handed to a parallel worker
+RANGES_PER_WORKER = 4  # Extra ranges per worker to balance uneven blocks
+_JSON_TOKEN = re.compile(
+    rb'"[^"\\\n]*(?:\\.[^"\\\n]*)*(?:(?P<close>["\n])|(?P<escape>\\)?\Z)|[\[\]{}]|' + re.escape(SUMMARY_MARKER),
+    re.DOTALL
+)
+_STRING_TOKEN = re.compile(rb'["\\\n]')
+_WHITESPACE = b" \t\r\n"
+
+# Define JSON decoding backends, fastest available first
+JSON_BACKENDS = {"json": json.loads}
+if orjson is not None:
+    JSON_BACKENDS["orjson"] = orjson.loads
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+MAX_RECOVERY_ATTEMPTS = 64  # Cut points tried when closing a truncated record
+_RECOVERY_TOKEN = re.compile(
+    r'"(?:[^"\\\n]|\\.)*(?:"|(?=\n)|$)'
+    r'|(?P<word>-?\b(?:nan|inf(?:inity)?|None|True|False)\b)'
+    r'|(?P<comma>,)(?=\s*[\]}])',
+    re.IGNORECASE
+)
+_RECOVERY_WORDS = {
+    "nan": "NaN", "-nan": "NaN",
+    "inf": "Infinity", "-inf": "-Infinity",
+    "infinity": "Infinity", "-infinity": "-Infinity",
+    "none": "null", "true": "true", "false": "false"
+}
+_STRUCTURE_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{},]')
+
+
+# Scanner that finds bracket-balanced summary blocks in a byte stream
+class _SummaryScanner:
+    """
+    Incremental state machine that locates '📊 Summary JSON:' markers and
+    the bracket-balanced JSON array that follows each of them.
+
+    Works on raw UTF-8 bytes: brackets, quotes and backslashes are ASCII and
+    never appear inside multi-byte sequences, so no decoding is needed.
+    Only the current (unfinished) block is buffered. A new marker outside a
+    string, or a raw newline inside one, means the current block was
+    truncated; it is still emitted so the decoder can salvage it.
+
+    Args:
+        offset (int): Absolute byte offset of the first byte fed.
+    """
+
+    _SEEK, _OPEN, _BLOCK = range(3)
+
+    def __init__(self, offset=0):
+        self.offset = offset
+        self._block_start = None
+        self._state = self._SEEK
+        self._buffer = bytearray()
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, data):
+        """
+        Consume the next chunk of the log.
+
+        Args:
+            data (bytes): Raw bytes appended to the stream.
+
+        Yields:
+            tuple: (marker offset, end offset, block bytes) for each complete
+                JSON block, in stream order.
+        """
+        pos = 0
+        while pos < len(data):
+            if self._state == self._SEEK:
+                pos = self._seek(data, pos)
+            elif self._state == self._OPEN:
+                pos = self._open(data, pos)
+            else:
+                block_start = self._block_start
+                pos, block = self._scan(data, pos)
+                if block is not None:
+                    yield block_start, self.offset + pos, block
+
+        self.offset += len(data)
+
+    def flush(self):
+        """
+        Emit the block still in progress at the end of a finished log.
+
+        Returns:
+            tuple: (marker offset, end offset, block bytes), or None.
+        """
+        pending = None
+        if self._state == self._BLOCK and self._buffer:
+            pending = (self._block_start, self.offset, bytes(self._buffer))
+        self._reset()
+        return pending
+
+    @property
+    def idle(self):
+        """bool: True when no summary block is in progress."""
+        return self._state == self._SEEK
+
+    @property
+    def resume_offset(self):
+        """int: Earliest offset a fresh scanner must restart from to lose nothing."""
+        if self._state == self._SEEK:
+            return self.offset - len(self._buffer)
+        return self._block_start
+
+    def _seek(self, data, pos):
+        keep = len(SUMMARY_MARKER) - 1
+
+        # Complete a marker split across the previous chunk boundary
+        if self._buffer:
+            head = bytes(self._buffer) + data[pos:pos + keep]
+            idx = head.find(SUMMARY_MARKER)
+            if idx >= 0:
+                consumed = idx + len(SUMMARY_MARKER) - len(self._buffer)
+                self._buffer = bytearray()
+                self._state = self._OPEN
+                self._block_start = self.offset + pos + consumed - len(SUMMARY_MARKER)
+                return pos + consumed
+            if len(data) - pos < keep:
+                self._buffer = bytearray(head[-keep:])
+                return len(data)
+            self._buffer = bytearray()
+
+        idx = data.find(SUMMARY_MARKER, pos)
+        if idx < 0:
+            self._buffer = bytearray(data[max(pos, len(data) - keep):])
+            return len(data)
+
+        self._state = self._OPEN
+        self._block_start = self.offset + idx
+        return idx + len(SUMMARY_MARKER)
+
+    def _open(self, data, pos):
+        # Skip whitespace after the marker; anything but '[' is not a summary
+        while pos < len(data) and data[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(data):
+            return pos
+
+        if data[pos:pos + 1] != b"[":
+            self._reset()
+            return pos
+
+        self._state = self._BLOCK
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        return pos
+
+    def _scan(self, data, pos):
+        start = pos
+        end = len(data)
+
+        # Detect a marker split across the previous chunk boundary
+        if pos == 0 and self._buffer and not (self._in_string or self._escape):
+            keep = len(SUMMARY_MARKER) - 1
+            tail = bytes(self._buffer[-keep:])
+            idx = (tail + data[:keep]).find(SUMMARY_MARKER)
+            if 0 <= idx < len(tail):
+                cut = len(self._buffer) - len(tail) + idx
+                return self._truncate(self._buffer[:cut], self.offset - len(tail) + idx,
+                                      idx + len(SUMMARY_MARKER) - len(tail))
+
+        while pos < end:
+            if self._escape:
+                self._escape = False
+                pos += 1
+                continue
+
+            if self._in_string:
+                match = _STRING_TOKEN.search(data, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.end()
+                if match.group() == b"\\":
+                    self._escape = True
+                else:
+                    # A closing quote, or a raw newline that breaks the string
+                    self._in_string = False
+                continue
+
+            # Whole strings are consumed in one match; only brackets loop here
+            for match in _JSON_TOKEN.finditer(data, pos):
+                token = match.group()
+                head = token[:1]
+                if head == b'"':
+                    if match.group("close") is None:
+                        # String continues in the next chunk
+                        self._in_string = True
+                        self._escape = match.group("escape") is not None
+                elif head in b"[{":
+                    self._depth += 1
+                elif head in b"]}":
+                    self._depth -= 1
+                    if self._depth == 0:
+                        pos = match.end()
+                        self._buffer += data[start:pos]
+                        block = bytes(self._buffer)
+                        self._reset()
+                        return pos, block
+                else:
+                    self._buffer += data[start:match.start()]
+                    return self._truncate(self._buffer, self.offset + match.start(), match.end())
+            pos = end
+
+        self._buffer += data[start:pos]
+        if len(self._buffer) > MAX_BLOCK_SIZE:
+            print(f"\n⚠️ Summary block exceeds {MAX_BLOCK_SIZE} bytes without closing — skipped")
+            self._reset()
+        return pos, None
+
+    def _truncate(self, block, marker_offset, pos):
+        # Emit a block cut short by a new marker and start parsing the new one
+        block = bytes(block)
+        self._reset()
+        self._state = self._OPEN
+        self._block_start = marker_offset
+        return pos, block
+
+    def _reset(self):
+        self._state = self._SEEK
+        self._block_start = None
+        self._buffer = bytearray()
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+
+# Function to normalize common non-JSON tokens in a malformed block
+def _normalize_block(text):
+    """
+    Rewrite the usual defects of hand-printed JSON into valid JSON.
+
+    Drops trailing commas, closes strings broken by a newline or the end of
+    the block, and maps Python-style nan/inf/None/True/False to JSON.
+
+    Args:
+        text (str): Malformed block text.
+
+    Returns:
+        str: Normalized block text.
+    """
+    def fix(match):
+        if match.group("comma"):
+            return ""
+        word = match.group("word")
+        if word:
+            return _RECOVERY_WORDS[word.lower()]
+        token = match.group()
+        if len(token) == 1 or not token.endswith('"') or token.endswith('\\"'):
+            return token + '"'
+        return token
+
+    return _RECOVERY_TOKEN.sub(fix, text)
+
+
+# Function to close the brackets left open by a truncated record
+def _close_record(fragment):
+    """
+    Try to decode one array element whose closing brackets are missing.
+
+    Only closing brackets are added; a record cut between a key and its
+    value is rejected rather than guessed.
+
+    Args:
+        fragment (str): Text of a single (possibly truncated) element.
+
+    Returns:
+        tuple: (True, value) on success, (False, None) otherwise.
+    """
+    fragment = fragment.rstrip().rstrip(",").rstrip()
+    stack = []
+    for match in _STRUCTURE_TOKEN.finditer(fragment):
+        token = match.group()
+        if token in "[{":
+            stack.append("]" if token == "[" else "}")
+        elif token in "]}" and stack:
+            stack.pop()
+
+    try:
+        return True, json.loads(fragment + "".join(reversed(stack)))
+    except json.JSONDecodeError:
+        return False, None
+
+
+# Function to salvage the valid records from a malformed block
+def _recover_block(text):
+    """
+    Decode a malformed summary array element by element.
+
+    Complete records are kept, a record missing only its closing brackets
+    is closed, and records that cannot be repaired are skipped.
+
+    Args:
+        text (str): Block text following the marker.
+
+    Returns:
+        list: Salvaged summary dictionaries.
+    """
+    text = _normalize_block(text)
+    decoder = json.JSONDecoder()
+    start = text.find("[")
+    if start < 0:
+        return []
+
+    records = []
+    pos = start + 1
+    attempts = 0
+    while pos < len(text) and attempts < MAX_RECOVERY_ATTEMPTS:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            break
+
+        try:
+            record, pos = decoder.raw_decode(text, pos)
+            records.append(record)
+            continue
+        except json.JSONDecodeError:
+            attempts += 1
+
+        # Find where this element ends: the next top-level comma or bracket
+        depth = 0
+        end = len(text)
+        for match in _STRUCTURE_TOKEN.finditer(text, pos):
+            token = match.group()
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth < 0:
+                    end = match.start()
+                    break
+            elif depth == 0:
+                end = match.start()
+                break
+
+        ok, record = _close_record(text[pos:end])
+        if ok:
+            records.append(record)
+        pos = max(end, pos + 1)
+
+    return records
+
+
+# Function to decode one summary block into a list of dictionaries
+def _decode_block(json_text, backend=None, messages=None):
+    """
+    Decode a single summary block.
+
+    Tries the selected backend first, then the stdlib parser (which also
+    accepts NaN/Infinity), and finally salvages what it can from a
+    malformed block.
+
+    Args:
+        json_text (bytes | str): JSON array text following the marker.
+        backend (str): Key of JSON_BACKENDS (defaults to JSON_BACKEND).
+        messages (list): Collects recovery and failure messages instead of
+            printing them, for callers that may still drop the block.
+
+    Returns:
+        list: Decoded summary dictionaries, or an empty list on failure.
+    """
+    loads = JSON_BACKENDS[backend or JSON_BACKEND]
+    try:
+        return loads(json_text)
+    except ValueError as e:
+        error = e
+
+    if loads is not json.loads:
+        try:
+            return json.loads(json_text)
+        except ValueError as e:
+            error = e
+
+    if isinstance(json_text, bytes):
+        json_text = json_text.decode("utf-8", errors="replace")
+
+    records = _recover_block(json_text)
+    if records:
+        message = f"\n🩹 Recovered {len(records)} entries from malformed block (Error: {error})"
+    else:
+        message = f"\n❌ Failed to parse block:\n{json_text}\nError: {error}"
+    if messages is None:
+        print(message)
+    else:
+        messages.append(message)
+    return records
+
+
+# Generator to stream summary JSON blocks from log file
+def _iter_summary_from_log(log_path, chunk_size=CHUNK_SIZE, backend=None):
+    """
+    Lazily yields summary dictionaries from a log file.
+
+    Reads the log in fixed-size chunks so memory stays flat regardless of
+    the log size; only the summary block being parsed is held in memory.
+
+    Args:
+        log_path (Path): Path to the log_*.txt file.
+        chunk_size (int): Number of bytes to read per iteration.
+        backend (str): Key of JSON_BACKENDS (defaults to JSON_BACKEND).
+
+    Yields:
+        dict: Each extracted summary dictionary, in file order.
+    """
+    scanner = _SummaryScanner()
+    with open(log_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            for _, _, block in scanner.feed(chunk):
+                yield from _decode_block(block, backend)
+
+    pending = scanner.flush()
+    if pending is not None:
+        yield from _decode_block(pending[2], backend)
+
+
+# Function to split a log into byte ranges aligned to summary markers
+def _split_log_ranges(mm, workers):
+    """
+    Split a memory-mapped log into byte ranges that each start at a marker.
+
+    Args:
+        mm (mmap.mmap): Memory-mapped log file.
+        workers (int): Number of worker processes.
+
+    Returns:
+        list: (start, end) byte ranges covering every marker, in file order.
+    """
+    size = len(mm)
+    count = max(1, min(workers * RANGES_PER_WORKER, size // MIN_RANGE_SIZE))
+    step = -(-size // count)
+
+    boundaries = []
+    for nominal in range(0, size, step):
+        idx = mm.find(SUMMARY_MARKER, nominal)
+        if idx < 0:
+            break
+        if not boundaries or idx > boundaries[-1]:
+            boundaries.append(idx)
+
+    return list(zip(boundaries, boundaries[1:] + [size]))
+
+
+# Worker that parses summary blocks whose marker falls in one byte range
+def _scan_log_range(log_path, start, end, chunk_size=CHUNK_SIZE, backend=None):
+    """
+    Parse the summary blocks whose markers start inside [start, end).
+
+    A block that begins before `end` is followed past it until it closes.
+    Parse messages are returned rather than printed: a range that starts at
+    a marker quoted inside an upstream block is discarded by the caller,
+    and its garbage blocks must not be reported.
+
+    Args:
+        log_path (Path): Path to the log_*.txt file.
+        start (int): First byte of the range.
+        end (int): First byte after the range.
+        chunk_size (int): Number of bytes fed to the scanner per iteration.
+        backend (str): Key of JSON_BACKENDS (defaults to JSON_BACKEND).
+
+    Returns:
+        list: (marker offset, end offset, summaries, messages) for each block.
+    """
+    blocks = []
+    scanner = _SummaryScanner(offset=start)
+
+    with open(log_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        while pos < len(mm) and (pos < end or not scanner.idle):
+            chunk = mm[pos:pos + chunk_size]
+            pos += len(chunk)
+            for block_start, block_end, block in scanner.feed(chunk):
+                if block_start >= end:
+                    return blocks
+                messages = []
+                blocks.append((block_start, block_end, _decode_block(block, backend, messages), messages))
+
+        # A block left open at the end of the log is salvaged, not dropped
+        pending = scanner.flush() if pos >= len(mm) else None
+        if pending is not None and pending[0] < end:
+            block_start, block_end, block = pending
+            messages = []
+            blocks.append((block_start, block_end, _decode_block(block, backend, messages), messages))
+
+    return blocks
+
+
+# Function to feed a byte range of an open log into a hash
+def _hash_log_range(fd, hasher, start, end, chunk_size=CHUNK_SIZE):
+    """
+    Update a hash with bytes [start, end) of an open file, without moving
+    the file position.
+
+    Args:
+        fd (int): File descriptor of the log.
+        hasher: hashlib object to update.
+        start (int): First byte to hash.
+        end (int): First byte after the range.
+        chunk_size (int): Number of bytes read per iteration.
+
+    Returns:
+        The updated hasher.
+    """
+    while start < end:
+        chunk = os.pread(fd, min(chunk_size, end - start), start)
+        if not chunk:
+            break
+        hasher.update(chunk)
+        start += len(chunk)
+    return hasher
+
+
+# Function to hash the part of a log a checkpoint has already consumed
+def _prefix_digest(log_path, length):
+    """
+    Hash the first `length` bytes of a log.
+
+    Args:
+        log_path (Path): Path to the log_*.txt file.
+        length (int): Number of bytes to hash.
+
+    Returns:
+        str: Hex digest of the prefix.
+    """
+    with open(log_path, "rb") as f:
+        return _hash_log_range(f.fileno(), hashlib.blake2b(digest_size=16), 0, length).hexdigest()
+
+
+# Function to hash the bytes just before a checkpoint offset
+def _window_digest(fd, offset):
+    """
+    Hash the last CHECKPOINT_WINDOW bytes before `offset` of an open log.
+
+    Args:
+        fd (int): File descriptor of the log.
+        offset (int): Checkpoint offset the window ends at.
+
+    Returns:
+        str: Hex digest of the window.
+    """
+    start = max(0, offset - CHECKPOINT_WINDOW)
+    return _hash_log_range(fd, hashlib.blake2b(digest_size=16), start, offset).hexdigest()
+
+
+# Worker that parses the bytes appended to a log since the last checkpoint
+def _scan_log_tail(log_path, offset, chunk_size=CHUNK_SIZE):
+    """
+    Parse summary blocks from `offset` to the current end of a log.
+
+    Args:
+        log_path (Path): Path to the log_*.txt file.
+        offset (int): Byte offset where the previous scan can resume.
+        chunk_size (int): Number of bytes read per iteration.
+
+    Returns:
+        tuple: (summaries, resume offset, scanned size, mtime, prefix
+            digest, window digest). The resume offset points at the marker
+            of any block still being written; the prefix digest covers every
+            byte before it, the window digest the last CHECKPOINT_WINDOW.
+    """
+    stat = log_path.stat()
+    summaries = []
+    scanner = _SummaryScanner(offset=offset)
+
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        remaining = stat.st_size - offset
+        while remaining > 0 and (chunk := f.read(min(chunk_size, remaining))):
+            remaining -= len(chunk)
+            for _, _, block in scanner.feed(chunk):
+                summaries.extend(_decode_block(block))
+
+        offset = scanner.resume_offset
+        window = _window_digest(f.fileno(), offset)
+    return summaries, offset, stat.st_size, stat.st_mtime_ns, _prefix_digest(log_path, offset), window
+
+
+# Function to extract summaries using every core on a memory-mapped log
+def _extract_summary_parallel(log_path, workers=None, backend=None):
+    """
+    Extracts all summary blocks from a log file with a process pool.
+
+    The log is memory-mapped, split into marker-aligned byte ranges and
+    each range is parsed by a separate process. Results keep file order.
+
+    Args:
+        log_path (Path): Path to the log_*.txt file.
+        workers (int): Number of worker processes (defaults to CPU count).
+        backend (str): Key of JSON_BACKENDS (defaults to JSON_BACKEND).
+            Resolved here and passed to every worker, since workers started
+            with spawn or forkserver do not see changes to module globals.
+
+    Returns:
+        list: A list of extracted dictionaries.
+    """
+    workers = workers or os.cpu_count() or 1
+    backend = backend or JSON_BACKEND
+
+    if log_path.stat().st_size == 0:
+        return []
+    with open(log_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ranges = _split_log_ranges(mm, workers)
+
+    if len(ranges) <= 1 or workers == 1:
+        return list(_iter_summary_from_log(log_path, backend=backend))
+
+    summaries = []
+    covered = 0
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        starts, ends = zip(*ranges)
+        count = len(ranges)
+        results = pool.map(_scan_log_range, [log_path] * count, starts, ends, [CHUNK_SIZE] * count, [backend] * count)
+        for start, end, blocks in zip(starts, ends, results):
+            # A range aligned to a marker quoted inside an upstream block is rescanned
+            if start < covered:
+                blocks = _scan_log_range(log_path, covered, end, backend=backend)
+            for _, block_end, entries, messages in blocks:
+                for message in messages:
+                    print(message)
+                summaries.extend(entries)
+                covered = block_end
+
+    return summaries
+
 
 # Function to extract summary JSON blocks from log file
 def _extract_summary_from_log(log_path):
@@ -28,10 +690,7 @@ def _extract_summary_from_log(log_path):
     summaries = []
     for block in matches:
         json_text = block.split("📊 Summary JSON:")[-1].strip()
-        try:
-            summaries.extend(json.loads(json_text))
-        except json.JSONDecodeError as e:
-            print(f"\n❌ Failed to parse block:\n{json_text}\nError: {e}")
+        summaries.extend(_decode_block(json_text))
 
     return summaries
 
@@ -52,6 +711,7 @@ def append_to_result_json(result_path, new_entries):
                 data = json.load(f)
         except json.JSONDecodeError:
             print(f"\n⚠️ Corrupted JSON: {result_path.name} — starting fresh")
+            _digest_index_path(result_path).unlink(missing_ok=True)
             data = []
     else:
         data = []
@@ -65,11 +725,454 @@ def append_to_result_json(result_path, new_entries):
     print(f"\n📄 Appended {len(new_entries)} entries → {result_path.name}")
 
 
+# Function to locate the sidecar index of a JSON Lines result store
+def _result_index_path(result_path):
+    """
+    Returns the path of the index kept next to a result_*.jsonl file.
+
+    Args:
+        result_path (Path): Path to result_*.jsonl file.
+
+    Returns:
+        Path: Path to the sidecar index file.
+    """
+    return result_path.with_name(result_path.name + ".idx")
+
+
+# Function to read (or rebuild) the index of a JSON Lines result store
+def _read_result_index(result_path):
+    """
+    Reads the entry count and committed byte size of a result_*.jsonl file.
+
+    The index is rebuilt by counting lines only when it is missing or does
+    not match the store; a tail written after the last index update (an
+    interrupted append) is truncated away.
+
+    Args:
+        result_path (Path): Path to result_*.jsonl file.
+
+    Returns:
+        dict: {'count': int, 'size': int} for the committed entries.
+    """
+    size = result_path.stat().st_size if result_path.exists() else 0
+    index_path = _result_index_path(result_path)
+
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        index = None
+
+    if index is not None and index["size"] == size:
+        return index
+
+    if index is not None and index["size"] < size:
+        print(f"\n⚠️ Interrupted append in {result_path.name} — dropping uncommitted tail")
+        os.truncate(result_path, index["size"])
+        return index
+
+    # Rebuild from scratch, keeping only complete lines
+    count = 0
+    committed = 0
+    if size:
+        with open(result_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                committed += len(line)
+                if line.strip():
+                    count += 1
+        if committed < size:
+            os.truncate(result_path, committed)
+
+    index = {"count": count, "size": committed}
+    _write_result_index(result_path, index)
+    return index
+
+
+# Function to atomically replace the index of a JSON Lines result store
+def _write_result_index(result_path, index):
+    """
+    Writes the sidecar index atomically.
+
+    Args:
+        result_path (Path): Path to result_*.jsonl file.
+        index (dict): {'count': int, 'size': int} to persist.
+    """
+    index_path = _result_index_path(result_path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path)
+
+
+# Function to append extracted summaries to result_*.jsonl
+def append_to_result_jsonl(result_path, new_entries):
+    """
+    Appends summary entries to an append-only JSON Lines result store.
+
+    Only the new entries are serialized and written, so the cost depends on
+    len(new_entries) rather than on the size of the existing store.
+
+    Args:
+        result_path (Path): Path to result_*.jsonl file.
+        new_entries (iterable): Result dictionaries to append.
+
+    Returns:
+        int: Number of entries appended.
+    """
+    index = _read_result_index(result_path)
+
+    appended = 0
+    with open(result_path, "ab") as f:
+        for entry in new_entries:
+            line = json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
+            f.write(line)
+            index["size"] += len(line)
+            appended += 1
+        f.flush()
+        os.fsync(f.fileno())
+
+    index["count"] += appended
+    _write_result_index(result_path, index)
+
+    print(f"\n📄 Appended {appended} entries → {result_path.name}")
+    return appended
+
+
+# Function to export a JSON Lines result store as the legacy JSON array
+def export_result_json(result_path, json_path=None):
+    """
+    Builds the legacy pretty-printed result_*.json from a result_*.jsonl store.
+
+    Entries are streamed one at a time; the output matches
+    json.dump(entries, f, indent=2). The default destination is named
+    'result_* (Export).json' so it never replaces a legacy JSON store.
+
+    Args:
+        result_path (Path): Path to result_*.jsonl file.
+        json_path (Path): Destination JSON file (defaults to
+            'result_<timestamp> (Export).json' next to the store).
+
+    Returns:
+        Path: Path of the exported JSON file.
+    """
+    if json_path is None:
+        stem = result_path.stem.replace(" (Repaired)", "")
+        json_path = result_path.with_name(f"{stem} (Export).json")
+    index = _read_result_index(result_path)
+
+    with open(result_path, "rb") as src, open(json_path, "w") as dst:
+        if not index["count"]:
+            dst.write("[]")
+        else:
+            dst.write("[")
+            separator = "\n"
+            remaining = index["size"]
+            for line in src:
+                remaining -= len(line)
+                if remaining < 0:
+                    break
+                if not line.strip():
+                    continue
+                entry = json.dumps(json.loads(line), indent=2)
+                dst.write(separator + "  " + entry.replace("\n", "\n  "))
+                separator = ",\n"
+            dst.write("\n]")
+
+    print(f"\n📤 Exported {index['count']} entries → {json_path.name}")
+    return json_path
+
+
+# Function to derive the result file that belongs to a log file
+def _result_path_for_log(log_file, store):
+    """
+    Derive the result file name from a log file name.
+
+    Args:
+        log_file (Path): Path to the log_*.txt file.
+        store (str): 'json' or 'jsonl'.
+
+    Returns:
+        Path: Path to the matching result_* (Repaired) file.
+    """
+    timestamp = log_file.stem.replace("log_", "")
+    return log_file.parent / f"result_{timestamp} (Repaired).{store}"
+
+
+# Function to compute a stable digest of one summary dictionary
+def _summary_digest(entry):
+    """
+    Hash a summary independently of key order and whitespace.
+
+    Args:
+        entry (dict): Summary dictionary.
+
+    Returns:
+        str: Hex digest identifying the summary's content.
+    """
+    canonical = json.dumps(entry, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Function to locate the digest index kept next to a result file
+def _digest_index_path(result_path):
+    """
+    Returns the path of the digest index kept next to a result file.
+
+    Args:
+        result_path (Path): Path to result_*.json or result_*.jsonl file.
+
+    Returns:
+        Path: Path to the sidecar digest file.
+    """
+    return result_path.with_name(result_path.name + ".digests")
+
+
+# Function to stamp a result file with its current size and mtime
+def _result_stamp(result_path):
+    """
+    Describe the state of a result file as recorded in its digest index.
+
+    Args:
+        result_path (Path): Path to result_*.json or result_*.jsonl file.
+
+    Returns:
+        str: Stamp line '@<size> <mtime_ns>'.
+    """
+    stat = result_path.stat()
+    return f"@{stat.st_size} {stat.st_mtime_ns}"
+
+
+# Function to load the digests of every summary already stored
+def _load_digest_index(result_path):
+    """
+    Loads the set of digests of summaries already in a result file.
+
+    The sidecar holds one digest per line, followed by a stamp line with
+    the result file's size and mtime after each update. It is trusted only
+    while the stamp matches the result file; a missing, emptied or
+    externally changed result file discards it and the index is rebuilt
+    from the store's actual contents.
+
+    Args:
+        result_path (Path): Path to result_*.json or result_*.jsonl file.
+
+    Returns:
+        set: Hex digests of stored summaries.
+    """
+    index_path = _digest_index_path(result_path)
+    if not result_path.exists() or result_path.stat().st_size == 0:
+        index_path.unlink(missing_ok=True)
+        return set()
+
+    digests = set()
+    stamp = None
+    try:
+        with open(index_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("@"):
+                    stamp = line
+                elif line:
+                    digests.add(line)
+    except FileNotFoundError:
+        pass
+    if stamp is not None and stamp == _result_stamp(result_path):
+        return digests
+
+    print(f"\n🔑 Building digest index for {result_path.name}")
+    digests = set()
+    try:
+        if result_path.suffix == ".jsonl":
+            _read_result_index(result_path)
+            with open(result_path, "r") as f:
+                entries = (json.loads(line) for line in f if line.strip())
+                digests.update(_summary_digest(entry) for entry in entries)
+        else:
+            with open(result_path, "r") as f:
+                digests.update(_summary_digest(entry) for entry in json.load(f))
+    except json.JSONDecodeError:
+        print(f"\n⚠️ Corrupted JSON: {result_path.name} — digest index left empty")
+
+    # Replace the stale sidecar rather than appending to it
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.writelines(f"{digest}\n" for digest in digests)
+        f.write(f"{_result_stamp(result_path)}\n")
+    os.replace(tmp_path, index_path)
+    return digests
+
+
+# Function to append new digests to the sidecar index
+def _record_digests(result_path, digests):
+    """
+    Appends digests to the sidecar index of a result file, followed by the
+    result file's new stamp.
+
+    Args:
+        result_path (Path): Path to result_*.json or result_*.jsonl file.
+        digests (iterable): Hex digests to record.
+    """
+    with open(_digest_index_path(result_path), "a") as f:
+        f.writelines(f"{digest}\n" for digest in digests)
+        f.write(f"{_result_stamp(result_path)}\n")
+
+
+# Function to append summaries to whichever result store is selected
+def _append_to_result(result_path, new_entries, store):
+    """
+    Append summary entries not yet stored to a result_*.json or
+    result_*.jsonl file.
+
+    Each summary is checked against the persistent digest index in O(1),
+    so reprocessing a log does not duplicate entries.
+
+    Args:
+        result_path (Path): Path to the result file.
+        new_entries (list): List of result dictionaries to append.
+        store (str): 'json' or 'jsonl'.
+
+    Returns:
+        int: Number of entries actually appended.
+    """
+    known = _load_digest_index(result_path)
+
+    unique_entries = []
+    new_digests = []
+    for entry in new_entries:
+        digest = _summary_digest(entry)
+        if digest in known:
+            continue
+        known.add(digest)
+        new_digests.append(digest)
+        unique_entries.append(entry)
+
+    skipped = len(new_entries) - len(unique_entries)
+    if skipped:
+        print(f"\n♻️ Skipped {skipped} duplicate entries already in {result_path.name}")
+    if not unique_entries:
+        return 0
+
+    if store == "jsonl":
+        append_to_result_jsonl(result_path, unique_entries)
+    else:
+        append_to_result_json(result_path, unique_entries)
+
+    _record_digests(result_path, new_digests)
+    return len(unique_entries)
+
+
+# Function to load the batch checkpoint manifest
+def _load_checkpoint(checkpoint_path):
+    """
+    Load the manifest of logs already scanned.
+
+    Args:
+        checkpoint_path (Path): Path to the checkpoint manifest.
+
+    Returns:
+        dict: Checkpoint key → {'path', 'size', 'mtime', 'offset', 'digest', 'window'}.
+    """
+    try:
+        with open(checkpoint_path, "r") as f:
+            manifest = json.load(f)
+        # Entries from before checkpoints were kept per result store are rescanned once
+        return {key: entry for key, entry in manifest.items() if key.split(":", 1)[0] in {"json", "jsonl"}}
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError:
+        print(f"\n⚠️ Corrupted checkpoint: {checkpoint_path.name} — rescanning all logs")
+        return {}
+
+
+# Function to atomically save the batch checkpoint manifest
+def _save_checkpoint(checkpoint_path, manifest):
+    """
+    Save the manifest of logs already scanned.
+
+    Args:
+        checkpoint_path (Path): Path to the checkpoint manifest.
+        manifest (dict): Checkpoint key → {'path', 'size', 'mtime', 'offset', 'digest', 'window'}.
+    """
+    tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, checkpoint_path)
+
+
+# Function to name the checkpoint entry of a log for one result store
+def _checkpoint_key(log_file, store):
+    """
+    Build the manifest key of a log, so each result store keeps its own
+    progress and one store being up to date never hides logs from another.
+
+    Args:
+        log_file (Path): Path to the log_*.txt file.
+        store (str): 'json' or 'jsonl'.
+
+    Returns:
+        str: '<store>:<log file name>'.
+    """
+    return f"{store}:{log_file.name}"
+
+
+# Function to decide where scanning of a log has to resume
+def _pending_offset(log_file, entry):
+    """
+    Compare a log file against its checkpoint entry.
+
+    A log that grew resumes at the checkpoint offset once the digest of the
+    CHECKPOINT_WINDOW bytes before it still matches, so appends cost no
+    full reread. A log that did not grow (touched, copied, truncated or
+    rewritten) is checked against the digest of every byte the checkpoint
+    consumed. Either way, changed bytes mean scanning from the start again.
+
+    Args:
+        log_file (Path): Path to the log_*.txt file.
+        entry (dict): Checkpoint entry, or None for a new log.
+
+    Returns:
+        int: Byte offset to resume scanning from, or None if unchanged.
+    """
+    stat = log_file.stat()
+    if entry is None:
+        return 0
+    if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime"]:
+        return None
+
+    offset = entry["offset"]
+    if stat.st_size > entry["size"] and "window" in entry:
+        # Appended to: the bytes just before the offset show a rewrite
+        with open(log_file, "rb") as f:
+            return offset if entry["window"] == _window_digest(f.fileno(), offset) else 0
+    if stat.st_size >= offset and entry.get("digest") == _prefix_digest(log_file, offset):
+        # Same consumed bytes: only the unfinished tail, if any, is rescanned
+        return None if stat.st_size == entry["size"] == offset else offset
+    # Rewritten in place: start over
+    return 0
+
+
 # Command center
-def process_log_to_result():
+def process_log_to_result(mode="stream", workers=None, store="json"):
     """
     Parse log file and update/create corresponding result JSON.
+
+    Args:
+        mode (str): 'stream' scans the log in constant memory,
+            'parallel' parses a memory-mapped log on a process pool,
+            'regex' reads the whole log and uses the legacy pattern.
+        workers (int): Worker processes for 'parallel' (defaults to CPU count).
+        store (str): 'json' rewrites the legacy result array,
+            'jsonl' appends to an append-only JSON Lines store.
+
+    Raises:
+        ValueError: If an unsupported mode or store is provided.
     """
+    if mode not in {"stream", "parallel", "regex"}:
+        raise ValueError(f"Unsupported extraction mode: {mode}")
+    if store not in {"json", "jsonl"}:
+        raise ValueError(f"Unsupported result store: {store}")
 
     # Step 1: Look for a single log_*.txt file in current directory
     log_files = list(CURRENT_DIR.glob("log_*.txt"))
@@ -82,20 +1185,373 @@ def process_log_to_result():
     print(f"\n📂 Parsing log file: {log_file.name}")
 
     # Step 3: Derive result file name from log file name
-    timestamp = log_file.stem.replace("log_", "")
-    result_path = CURRENT_DIR / f"result_{timestamp} (Repaired).json"
+    result_path = _result_path_for_log(log_file, store)
 
     # Step 4: Extract all summary JSON blocks
-    summaries = _extract_summary_from_log(log_file)
+    if mode == "stream":
+        summaries = list(_iter_summary_from_log(log_file))
+    elif mode == "parallel":
+        summaries = _extract_summary_parallel(log_file, workers)
+    else:
+        summaries = _extract_summary_from_log(log_file)
     if not summaries:
         print("\n⚠️ No summary blocks found.")
         return
 
     # Step 5: Append extracted blocks to JSON
-    append_to_result_json(result_path, summaries)
+    added = _append_to_result(result_path, summaries, store)
+
+    print(f"\n✅ {added} entries added to {result_path.name}")
+
+
+# Command center for every log in the directory
+def process_all_logs_to_results(workers=None, store="json", checkpoint_path=CHECKPOINT_PATH):
+    """
+    Parse every log_*.txt file and update/create the corresponding results.
+
+    A checkpoint manifest records the size, mtime and resume offset of each
+    log per result store, so a rerun only scans new logs and bytes appended
+    since the last run that wrote to the same store.
+    Logs that need work are scanned concurrently in a process pool.
+
+    Args:
+        workers (int): Worker processes (defaults to CPU count).
+        store (str): 'json' rewrites the legacy result array,
+            'jsonl' appends to an append-only JSON Lines store.
+        checkpoint_path (Path): Path to the checkpoint manifest.
+
+    Raises:
+        ValueError: If an unsupported store is provided.
+    """
+    if store not in {"json", "jsonl"}:
+        raise ValueError(f"Unsupported result store: {store}")
+
+    # Step 1: Look for every log_*.txt file in current directory
+    log_files = sorted(CURRENT_DIR.glob("log_*.txt"))
+    if not log_files:
+        print("\n❌ No log_*.txt file found")
+        return
+
+    # Step 2: Keep only new logs and logs that grew since the last run
+    manifest = _load_checkpoint(checkpoint_path)
+    pending = {}
+    for log_file in log_files:
+        offset = _pending_offset(log_file, manifest.get(_checkpoint_key(log_file, store)))
+        if offset is not None:
+            pending[log_file] = offset
+
+    print(f"\n📂 {len(pending)} of {len(log_files)} log files need parsing")
+    if not pending:
+        return
+
+    # Step 3: Scan pending tails, in-process when a pool is not worth it
+    workers = workers or os.cpu_count() or 1
+    if len(pending) == 1 or workers == 1:
+        results = ((log_file, _scan_log_tail(log_file, offset)) for log_file, offset in pending.items())
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(pending)))
+        futures = {pool.submit(_scan_log_tail, log_file, offset): log_file
+                   for log_file, offset in pending.items()}
+        results = ((futures[future], future.result()) for future in as_completed(futures))
+
+    # Step 4: Append each log's summaries and checkpoint it as soon as it finishes
+    total = 0
+    try:
+        for log_file, (summaries, offset, size, mtime, digest, window) in results:
+            if summaries:
+                total += _append_to_result(_result_path_for_log(log_file, store), summaries, store)
+            manifest[_checkpoint_key(log_file, store)] = {
+                "path": str(log_file),
+                "size": size,
+                "mtime": mtime,
+                "offset": offset,
+                "digest": digest,
+                "window": window
+            }
+            _save_checkpoint(checkpoint_path, manifest)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    print(f"\n✅ {total} entries added from {len(pending)} log files")
+
+
+# Watcher that blocks until files in a directory change
+class _LogWatcher:
+    """
+    Waits for changes in a directory using Linux inotify, or falls back to
+    sleeping for POLL_INTERVAL where inotify is not available.
+
+    inotify is called through ctypes, so no extra package is needed. While
+    nothing is written the process sleeps in select() and uses no CPU.
+
+    Args:
+        directory (Path): Directory holding the log files.
+        poll_interval (float): Sleep between checks in polling mode.
+    """
+
+    def __init__(self, directory, poll_interval=POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._fd = self._open_inotify(directory)
+
+    @property
+    def polling(self):
+        """bool: True when changes are found by polling instead of inotify."""
+        return self._fd is None
+
+    @staticmethod
+    def _open_inotify(directory):
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+            if libc.inotify_add_watch(fd, str(directory).encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def wait(self, timeout=None):
+        """
+        Block until a file changes or the timeout expires.
+
+        Args:
+            timeout (float): Seconds to wait at most (None waits forever).
+
+        Returns:
+            set: Names of changed files, or None in polling mode, where
+                every file has to be checked.
+        """
+        if self._fd is None:
+            time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+            return None
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        names = set()
+        overflow = False
+        if not ready:
+            return names
+
+        while True:
+            try:
+                data = os.read(self._fd, 1 << 16)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos < len(data):
+                _, mask, _, length = _INOTIFY_EVENT.unpack_from(data, pos)
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were dropped: check every file
+                    overflow = True
+                pos += _INOTIFY_EVENT.size
+                names.add(data[pos:pos + length].rstrip(b"\0").decode("utf-8", "replace"))
+                pos += length
+        return None if overflow else names
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+# Follower that parses the bytes appended to one log as they arrive
+class _LogFollower:
+    """
+    Keeps a log open with a persistent _SummaryScanner, so each read only
+    parses newly appended bytes and a block split across two writes is
+    completed by the next read.
+
+    Args:
+        log_file (Path): Path to the log_*.txt file.
+        offset (int): Byte offset to start parsing from.
+    """
+
+    def __init__(self, log_file, offset=0):
+        self.log_file = log_file
+        self._open(offset)
+
+    def _open(self, offset):
+        self._file = open(self.log_file, "rb")
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self._file.seek(offset)
+        self.scanner = _SummaryScanner(offset=offset)
+        self.mtime = None
+        # Running digest of the consumed prefix, extended at each checkpoint
+        self._hasher = _hash_log_range(self._file.fileno(), hashlib.blake2b(digest_size=16), 0, offset)
+        self._hashed = offset
+
+    def read(self):
+        """
+        Parse everything appended since the last read.
+
+        A log that was truncated or replaced is parsed again from the start.
+
+        Returns:
+            list: Summaries completed by the new bytes.
+        """
+        try:
+            stat = self.log_file.stat()
+        except FileNotFoundError:
+            return []
+        if stat.st_ino != self._inode or stat.st_size < self.scanner.offset:
+            print(f"\n🔄 {self.log_file.name} was truncated or replaced — following from the start")
+            self.close()
+            self._open(0)
+
+        summaries = []
+        while chunk := self._file.read(CHUNK_SIZE):
+            for _, _, block in self.scanner.feed(chunk):
+                summaries.extend(_decode_block(block))
+        self.mtime = stat.st_mtime_ns
+        return summaries
+
+    def checkpoint(self):
+        """
+        Returns:
+            dict: Checkpoint entry resuming at the block still being written.
+        """
+        offset = self.scanner.resume_offset
+        if offset < self._hashed:
+            self._hasher, self._hashed = hashlib.blake2b(digest_size=16), 0
+        _hash_log_range(self._file.fileno(), self._hasher, self._hashed, offset)
+        self._hashed = offset
+        return {
+            "path": str(self.log_file),
+            "size": self.scanner.offset,
+            "mtime": self.mtime,
+            "offset": offset,
+            "digest": self._hasher.hexdigest(),
+            "window": _window_digest(self._file.fileno(), offset)
+        }
+
+    def close(self):
+        self._file.close()
+
+
+# Command center that keeps results up to date while logs are written
+def follow_logs(store="jsonl", checkpoint_path=CHECKPOINT_PATH, poll_interval=POLL_INTERVAL,
+                flush_interval=FLUSH_INTERVAL, duration=None):
+    """
+    Follow every log_*.txt file and store summaries as they are written.
+
+    Each log is parsed from its checkpoint offset and then only appended
+    bytes are read, on inotify events (or every `poll_interval` seconds
+    where inotify is unavailable). Parsed summaries are stored within
+    `flush_interval` seconds, or sooner once FLUSH_MAX_ENTRIES are waiting,
+    and the checkpoint is updated after each flush so batch runs and later
+    follow runs on the same store resume where this one stopped. Other
+    stores keep their own checkpoint entries and still get every summary.
+
+    Args:
+        store (str): 'jsonl' appends to a JSON Lines store (recommended,
+            each flush costs O(new entries)), 'json' rewrites the legacy array.
+        checkpoint_path (Path): Path to the checkpoint manifest.
+        poll_interval (float): Seconds between checks in polling mode.
+        flush_interval (float): Longest delay before a summary is stored.
+        duration (float): Stop after this many seconds (None runs until Ctrl+C).
+
+    Raises:
+        ValueError: If an unsupported store is provided.
+    """
+    if store not in {"json", "jsonl"}:
+        raise ValueError(f"Unsupported result store: {store}")
+
+    manifest = _load_checkpoint(checkpoint_path)
+    watcher = _LogWatcher(CURRENT_DIR, poll_interval)
+    followers = {}
+    pending = {}
+    flush_deadline = None
+    stop_at = None if duration is None else time.monotonic() + duration
+    total = 0
+
+    def add_new_logs():
+        for log_file in sorted(CURRENT_DIR.glob("log_*.txt")):
+            if log_file.name in followers:
+                continue
+            entry = manifest.get(_checkpoint_key(log_file, store))
+            offset = _pending_offset(log_file, entry)
+            if offset is None:
+                offset = entry["offset"]
+            followers[log_file.name] = _LogFollower(log_file, offset)
+            print(f"\n👀 Following {log_file.name} from byte {offset}")
+
+    def flush():
+        nonlocal total
+        for name, summaries in pending.items():
+            log_file = followers[name].log_file
+            added = _append_to_result(_result_path_for_log(log_file, store), summaries, store)
+            total += added
+            if added:
+                print(f"\n✅ {added} entries added to {_result_path_for_log(log_file, store).name}")
+        for name, follower in followers.items():
+            if follower.mtime is not None:
+                manifest[_checkpoint_key(follower.log_file, store)] = follower.checkpoint()
+        _save_checkpoint(checkpoint_path, manifest)
+        pending.clear()
+
+    mode = "polling" if watcher.polling else "inotify"
+    print(f"\n📡 Following log_*.txt files in {CURRENT_DIR} ({mode}, Ctrl+C to stop)")
+    add_new_logs()
+    changed = None  # None means every log has to be checked
+
+    try:
+        while True:
+            if changed is None or any(name.startswith("log_") and name not in followers for name in changed):
+                add_new_logs()
+
+            for name, follower in followers.items():
+                if changed is not None and name not in changed:
+                    continue
+                summaries = follower.read()
+                if summaries:
+                    pending.setdefault(name, []).extend(summaries)
+                    if flush_deadline is None:
+                        flush_deadline = time.monotonic() + flush_interval
+
+            now = time.monotonic()
+            waiting = sum(len(summaries) for summaries in pending.values())
+            if pending and (now >= flush_deadline or waiting >= FLUSH_MAX_ENTRIES):
+                flush()
+                flush_deadline = None
+
+            if stop_at is not None and now >= stop_at:
+                break
+
+            # Sleep until the next change, flush deadline or stop time
+            deadlines = [t for t in (flush_deadline, stop_at) if t is not None]
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            changed = watcher.wait(timeout)
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping follow mode")
+    finally:
+        flush()
+        watcher.close()
+        for follower in followers.values():
+            follower.close()
+
+    print(f"\n✅ {total} entries added while following")
+
+# Guard the entry point so pool workers can re-import this module safely
+if __name__ == "__main__":
+    process_log_to_result()
+
+    # Parse one large log on every core
+    # process_log_to_result(mode="parallel")
+
+    # Parse every log, resuming from the checkpoint manifest
+    # process_all_logs_to_results()
 
-    print(f"\n✅ {len(summaries)} entries added to {result_path.name}")
+    # Keep JSON Lines results up to date while training is still writing logs
+    # follow_logs()
 
-process_log_to_result()
+    # Append to a JSON Lines store, then build the legacy array on demand
+    # process_log_to_result(store="jsonl")
+    # export_result_json(CURRENT_DIR / "result_<timestamp> (Repaired).jsonl")
 
-print("\n✅ parse.py successfully executed")
+    print("\n✅ parse.py successfully executed")
@@ -0,0 +1,216 @@
+# Import third-party libraries
+from PIL import Image
+
+# Import standard libraries
+import os
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Import project-specific modules
+from load import load_image, FRAME_PATH
+from frame import slice_frame_edges, build_frame, EDGE_SLICE
+
+# Define constants
+CURRENT_DIR = Path(__file__).parent
+ARTWORK_DIR = CURRENT_DIR / "artworks"
+OUTPUT_DIR = CURRENT_DIR / "output"
+ARTWORK_EXTENSIONS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".webp"}
+FRAME_CACHE_SIZE = 8  # Sliced frames kept in memory per process
+
+# Function to load and slice a frame once per process
+"""
+Load a frame image and slice it, caching the parts by path and slice size.
+
+The returned images are shared between calls and must not be modified.
+
+Args:
+    frame_path (Path): Path to the frame image.
+    edge_slice (int): Frame slice thickness in pixels.
+
+Returns:
+    dict: Dictionary containing cropped edge and corner images.
+"""
+@lru_cache(maxsize=FRAME_CACHE_SIZE)
+def load_frame_parts(frame_path, edge_slice):
+    return slice_frame_edges(load_image(Path(frame_path)), edge_slice)
+
+# Function to save one rendered mockup
+"""
+Encode a rendered frame and write it to disk.
+
+Args:
+    image (Image.Image): Rendered RGBA frame.
+    output_path (Path): Destination file.
+"""
+def _save_mockup(image, output_path):
+    image.convert("RGB").save(output_path)
+
+# Worker that renders a chunk of artworks with pipelined output writing
+"""
+Render mockups for a chunk of artworks, encoding each one on a writer
+thread while the next one renders.
+
+At most one image is rendering and one is encoding at any time.
+
+Args:
+    artworks (list): (artwork path, output file name) pairs to frame.
+    frame_path (Path): Path to the frame image.
+    edge_slice (int): Frame slice thickness in pixels.
+    output_dir (Path): Folder for the rendered mockups.
+    mode (str): 'tile' or 'stretch' edge rendering.
+
+Returns:
+    list: (artwork path, error message or None) per artwork.
+"""
+def _render_chunk(artworks, frame_path, edge_slice, output_dir, mode):
+    frame_parts = load_frame_parts(str(frame_path), edge_slice)
+    results = []
+    pending = None
+
+    def finish(previous):
+        path, future = previous
+        try:
+            future.result()
+            results.append((path, None))
+        except Exception as e:
+            results.append((path, f"{type(e).__name__}: {e}"))
+
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        for artwork_path, output_name in artworks:
+            try:
+                # Only the header is read: the frame needs the size, not the pixels
+                with Image.open(artwork_path) as artwork:
+                    size = artwork.size
+                image = build_frame(size, frame_parts, edge_slice, mode)
+            except Exception as e:
+                results.append((artwork_path, f"{type(e).__name__}: {e}"))
+                continue
+
+            if pending is not None:
+                finish(pending)
+            output_path = output_dir / output_name
+            pending = (artwork_path, writer.submit(_save_mockup, image, output_path))
+
+        if pending is not None:
+            finish(pending)
+
+    return results
+
+# Generator to list artworks in a folder
+"""
+Yield every image file in a folder, sorted by name.
+
+A missing folder is reported and yields nothing.
+
+Args:
+    artwork_dir (Path): Folder holding the artworks.
+
+Yields:
+    Path: Each artwork file.
+"""
+def iter_artworks(artwork_dir):
+    artwork_dir = Path(artwork_dir)
+    if not artwork_dir.is_dir():
+        print(f"\n❌ Artwork folder not found: {artwork_dir}")
+        return
+    for path in sorted(artwork_dir.iterdir()):
+        if path.suffix.lower() in ARTWORK_EXTENSIONS and path.is_file():
+            yield path
+
+# Function to give every artwork a unique output file name
+"""
+Name each mockup after its artwork. Artworks sharing a stem (a.jpg and
+a.png) keep their extension in the name (a_jpg.png, a_png.png) so they do
+not overwrite each other.
+
+Args:
+    artwork_paths (list): Artworks to frame.
+
+Returns:
+    list: Output file name of each artwork, in the same order.
+"""
+def _output_names(artwork_paths):
+    stems = [Path(path).stem for path in artwork_paths]
+    counts = {}
+    for stem in stems:
+        counts[stem.lower()] = counts.get(stem.lower(), 0) + 1
+
+    names = []
+    used = set()
+    for path, stem in zip(artwork_paths, stems):
+        if counts[stem.lower()] > 1:
+            stem = f"{stem}_{Path(path).suffix.lstrip('.').lower()}"
+        name = stem
+        n = 2
+        while name.lower() in used:
+            name = f"{stem}_{n}"
+            n += 1
+        used.add(name.lower())
+        names.append(f"{name}.png")
+    return names
+
+# Function to generate mockups for a whole catalog
+"""
+Render a framed mockup for every artwork on a process pool.
+
+Each worker slices the frame once (LRU-cached) and pipelines encoding
+with rendering. One failing artwork does not stop the batch.
+
+Args:
+    artwork_paths (list): Artworks to frame.
+    frame_path (Path): Path to the frame image.
+    edge_slice (int): Frame slice thickness in pixels.
+    output_dir (Path): Folder for the rendered mockups.
+    workers (int): Worker processes (None for CPU count).
+    mode (str): 'tile' or 'stretch' edge rendering.
+
+Returns:
+    dict: Artwork path → error message for every failed artwork.
+"""
+def generate_mockups(artwork_paths, frame_path=FRAME_PATH, edge_slice=EDGE_SLICE,
+                     output_dir=OUTPUT_DIR, workers=None, mode="tile"):
+    artwork_paths = list(artwork_paths)
+    if not artwork_paths:
+        print("\n❌ No artworks to render")
+        return {}
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, len(artwork_paths))
+
+    # Several chunks per worker keep the pool balanced when sizes vary
+    artworks = list(zip(artwork_paths, _output_names(artwork_paths)))
+    chunk_size = max(1, len(artworks) // (workers * 4))
+    chunks = [artworks[i:i + chunk_size] for i in range(0, len(artworks), chunk_size)]
+
+    print(f"\n🖼️ Rendering {len(artwork_paths)} mockups with {workers} workers...")
+    results = []
+    if workers == 1:
+        for chunk in chunks:
+            results.extend(_render_chunk(chunk, frame_path, edge_slice, output_dir, mode))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_render_chunk, chunk, frame_path, edge_slice, output_dir, mode)
+                for chunk in chunks
+            ]
+            for future in futures:
+                results.extend(future.result())
+
+    failures = {path: error for path, error in results if error is not None}
+    print(f"\n📊 Rendered {len(results) - len(failures)} of {len(results)} mockups → {output_dir}")
+    for path, error in failures.items():
+        print(f"❌ {Path(path).name}: {error}")
+
+    return failures
+
+# Render every artwork in the catalog folder (only when run as a script)
+if __name__ == "__main__":
+    generate_mockups(iter_artworks(ARTWORK_DIR))
+
+    # Stretch edges instead of tiling them, on four workers
+    # generate_mockups(iter_artworks(ARTWORK_DIR), workers=4, mode="stretch")
+
+    # Print confirmation message
+    print("\n✅ batch.py successfully executed")
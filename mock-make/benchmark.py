@@ -0,0 +1,108 @@
+# Import third-party libraries
+from PIL import Image
+
+# Import standard libraries
+import time
+
+# Import project-specific modules
+from load import load_image, FRAME_PATH
+from frame import slice_frame_edges, _paste_edge, build_frame, EDGE_SLICE
+
+# Define benchmark constants
+ARTWORK_SIZES = [512, 1024, 2048, 4096, 8192, 16384]  # Square artwork sides in pixels
+REPEATS = 5
+
+# Function to paste edges with the original one-paste-per-tile loops
+"""
+Reference edge renderer that pastes every edge slice individually.
+
+Args:
+    canvas (Image.Image): Preallocated frame canvas.
+    frame_parts (dict): Dictionary of sliced frame images.
+    edge_width (int): Width of the frame edges.
+"""
+def render_edges_looped(canvas, frame_parts, edge_width):
+    new_w, new_h = canvas.size
+
+    for x in range(edge_width, new_w - edge_width, frame_parts["top_edge"].width):
+        canvas.paste(frame_parts["top_edge"], (x, 0))
+        canvas.paste(frame_parts["bottom_edge"], (x, new_h - edge_width))
+
+    for y in range(edge_width, new_h - edge_width, frame_parts["left_edge"].height):
+        canvas.paste(frame_parts["left_edge"], (0, y))
+        canvas.paste(frame_parts["right_edge"], (new_w - edge_width, y))
+
+# Function to paste edges the way build_frame does
+"""
+Edge renderer used by build_frame: each side tiled in place, directly for
+a few tiles and by doubling the filled span for many.
+
+Args:
+    canvas (Image.Image): Preallocated frame canvas.
+    frame_parts (dict): Dictionary of sliced frame images.
+    edge_width (int): Width of the frame edges.
+    mode (str): 'tile' or 'stretch'.
+"""
+def render_edges_in_place(canvas, frame_parts, edge_width, mode="tile"):
+    new_w, new_h = canvas.size
+    art_w, art_h = new_w - 2 * edge_width, new_h - 2 * edge_width
+
+    _paste_edge(canvas, frame_parts["top_edge"], (edge_width, 0), art_w, True, mode)
+    _paste_edge(canvas, frame_parts["bottom_edge"], (edge_width, new_h - edge_width), art_w, True, mode)
+    _paste_edge(canvas, frame_parts["left_edge"], (0, edge_width), art_h, False, mode)
+    _paste_edge(canvas, frame_parts["right_edge"], (new_w - edge_width, edge_width), art_h, False, mode)
+
+# Function to time a callable
+"""
+Return the best wall time of several runs.
+
+Args:
+    run (function): Callable to time.
+
+Returns:
+    float: Best time in seconds.
+"""
+def _best_time(run):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# Function to compare edge renderers across artwork sizes
+"""
+Time the looped edge renderer against build_frame's edge renderer in tile
+and stretch mode, on a canvas allocated once per size, plus the full build_frame call.
+
+Args:
+    sizes (list): Square artwork sides to test.
+    edge_slice (int): Frame slice thickness in pixels.
+"""
+def run_benchmark(sizes=ARTWORK_SIZES, edge_slice=EDGE_SLICE):
+    frame_parts = slice_frame_edges(load_image(FRAME_PATH), edge_slice)
+
+    # Square slices are the worst case for the looped renderer
+    square_parts = dict(frame_parts)
+    for name in ("top_edge", "bottom_edge", "left_edge", "right_edge"):
+        square_parts[name] = frame_parts[name].crop((0, 0, edge_slice, edge_slice))
+
+    for label, parts in [("frame.jpg slices", frame_parts), (f"{edge_slice}px square slices", square_parts)]:
+        print(f"\n🧪 {label}")
+        for side in sizes:
+            canvas = Image.new("RGBA", (side + 2 * edge_slice,) * 2, (0, 0, 0, 0))
+            looped = _best_time(lambda: render_edges_looped(canvas, parts, edge_slice))
+            tiled = _best_time(lambda: render_edges_in_place(canvas, parts, edge_slice))
+            stretched = _best_time(lambda: render_edges_in_place(canvas, parts, edge_slice, "stretch"))
+            full = _best_time(lambda: build_frame((side, side), parts, edge_slice))
+            print(f"⏱️ {side:>6}px  edges: looped {looped * 1000:8.2f} ms  tiled {tiled * 1000:8.2f} ms  "
+                  f"stretched {stretched * 1000:8.2f} ms  |  build_frame {full:6.3f} s")
+
+# Command center
+if __name__ == "__main__":
+    run_benchmark()
+
+    # Quick run on small artworks
+    # run_benchmark([512, 1024, 2048])
+
+    print("\n✅ benchmark.py successfully executed")
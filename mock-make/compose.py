@@ -0,0 +1,226 @@
+# Import third-party libraries
+from PIL import Image
+
+# Import standard libraries
+import os
+import shutil
+import hashlib
+from pathlib import Path
+
+# Import project-specific modules
+from load import LazyImage, load_image, BACKGROUND_PATH, FRAME_PATH, ARTWORK_PATH
+from frame import slice_frame_edges, build_frame, EDGE_SLICE
+
+# Define constants
+CURRENT_DIR = Path(__file__).parent
+OUTPUT_PATH = CURRENT_DIR / "mockup.png"
+CACHE_DIR = CURRENT_DIR / ".render_cache"
+ARTWORK_SCALE = 0.5            # Framed artwork width as a fraction of the background width
+ARTWORK_POSITION = (0.5, 0.5)  # Center of the framed artwork, as fractions of the background
+
+# Content digests keyed by (path, size, mtime), so unchanged files are hashed once
+_DIGESTS = {}
+
+# Function to hash an input file's content
+"""
+Compute the SHA-256 of a file's content, reusing the last digest while the
+file's size and modification time are unchanged.
+
+Args:
+    path (Path): File to hash.
+
+Returns:
+    str: Hex digest of the file content.
+"""
+def _file_digest(path):
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    if key not in _DIGESTS:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        _DIGESTS[key] = digest.hexdigest()
+    return _DIGESTS[key]
+
+# Function to build a cache key from input digests and render parameters
+"""
+Hash a layer's inputs and parameters into a cache key.
+
+Args:
+    *parts: Digests and parameters that fully determine the layer.
+
+Returns:
+    str: Hex key for the layer.
+"""
+def _layer_key(*parts):
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+# Function to write a cache entry without leaving partial files behind
+"""
+Store an image (saved as a fast-compressed PNG) or an existing file in the
+cache, writing to a temporary file first and moving it into place.
+
+Args:
+    source (Image.Image | Path): Image to encode, or file to copy.
+    path (Path): Final cache path.
+"""
+def _store_layer(source, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    if isinstance(source, Image.Image):
+        source.save(tmp_path, format="PNG", compress_level=1)
+    else:
+        shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, path)
+
+# Function to size the artwork for a given background and scale
+"""
+Compute the artwork's display size so the framed artwork spans `scale`
+of the background width, keeping the artwork's aspect ratio.
+
+Args:
+    background_size (tuple): Width and height of the background.
+    artwork_size (tuple): Source width and height of the artwork.
+    scale (float): Framed artwork width as a fraction of the background width.
+    edge_width (int): Width of the frame edges.
+
+Returns:
+    tuple: Display (width, height) of the artwork inside the frame.
+"""
+def artwork_display_size(background_size, artwork_size, scale, edge_width):
+    framed_w = round(background_size[0] * scale)
+    art_w = max(1, framed_w - 2 * edge_width)
+    art_h = max(1, round(art_w * artwork_size[1] / artwork_size[0]))
+    return art_w, art_h
+
+# Function to put an artwork inside a frame built for it
+"""
+Build a frame around an artwork and place the artwork inside it.
+
+Args:
+    artwork (Image.Image): Artwork already at its display size.
+    frame_parts (dict): Dictionary of sliced frame images.
+    edge_width (int): Width of the frame edges.
+    mode (str): 'tile' or 'stretch' edge rendering.
+
+Returns:
+    Image.Image: Framed artwork in RGBA mode.
+"""
+def frame_artwork(artwork, frame_parts, edge_width, mode="tile"):
+    framed = build_frame(artwork.size, frame_parts, edge_width, mode)
+    framed.paste(artwork, (edge_width, edge_width))
+    return framed
+
+# Function to place a framed artwork on the background
+"""
+Composite a framed artwork onto a copy of the background.
+
+Args:
+    background (Image.Image): Background image in RGBA mode.
+    framed (Image.Image): Framed artwork in RGBA mode.
+    position (tuple): Center of the framed artwork as (x, y) fractions of
+        the background size.
+
+Returns:
+    Image.Image: The composited mockup.
+"""
+def place_on_background(background, framed, position=ARTWORK_POSITION):
+    result = background.copy()
+    x = round(background.width * position[0] - framed.width / 2)
+    y = round(background.height * position[1] - framed.height / 2)
+    result.paste(framed, (x, y), framed)
+    return result
+
+# Function to render a full mockup through the layer cache
+"""
+Render artwork → frame → background, reusing cached layers.
+
+Two layers are cached under `cache_dir`, keyed by the content hashes of
+their inputs plus every parameter that affects them:
+
+- framed: artwork + frame + edge_slice + mode + display size
+- mockup: framed layer + background + position + scale + output format
+
+An unchanged mockup is copied straight from the cache without decoding
+anything. A new background or position reuses the cached framed layer and
+only recomposites; a new artwork or frame rebuilds both layers.
+
+Args:
+    background_path (Path): Path to the background image.
+    frame_path (Path): Path to the frame image.
+    artwork_path (Path): Path to the artwork image.
+    output_path (Path): Where to write the mockup.
+    position (tuple): Center of the framed artwork as background fractions.
+    scale (float): Framed artwork width as a fraction of the background width.
+    edge_slice (int): Frame slice thickness in pixels.
+    mode (str): 'tile' or 'stretch' edge rendering.
+    cache_dir (Path): Folder for cached layers (None disables the cache).
+
+Returns:
+    str: 'cached', 'recomposited' or 'rendered'.
+"""
+def compose_mockup(background_path=BACKGROUND_PATH, frame_path=FRAME_PATH, artwork_path=ARTWORK_PATH,
+                   output_path=OUTPUT_PATH, position=ARTWORK_POSITION, scale=ARTWORK_SCALE,
+                   edge_slice=EDGE_SLICE, mode="tile", cache_dir=CACHE_DIR):
+    output_path = Path(output_path)
+    background = LazyImage(background_path)
+    artwork = LazyImage(artwork_path)
+    art_size = artwork_display_size(background.size, artwork.size, scale, edge_slice)
+
+    # Keys come from file hashes and image headers only; nothing is decoded yet
+    framed_key = _layer_key(
+        _file_digest(artwork_path), _file_digest(frame_path), edge_slice, mode, art_size
+    )
+    mockup_key = _layer_key(
+        framed_key, _file_digest(background_path), tuple(position), scale, output_path.suffix.lower()
+    )
+
+    framed_path = mockup_path = None
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        framed_path = cache_dir / "framed" / f"{framed_key}.png"
+        mockup_path = cache_dir / "mockup" / f"{mockup_key}{output_path.suffix.lower()}"
+
+        if mockup_path.exists():
+            shutil.copyfile(mockup_path, output_path)
+            print(f"📦 Cache hit: {output_path.name}")
+            return "cached"
+
+    if framed_path is not None and framed_path.exists():
+        framed = load_image(framed_path)
+        status = "recomposited"
+    else:
+        # Decode the artwork no larger than needed, then resize to the exact size
+        artwork = LazyImage(artwork_path, target_size=art_size).image
+        if artwork.size != art_size:
+            artwork = artwork.resize(art_size, Image.LANCZOS)
+        frame_parts = slice_frame_edges(load_image(frame_path), edge_slice)
+        framed = frame_artwork(artwork, frame_parts, edge_slice, mode)
+        if framed_path is not None:
+            _store_layer(framed, framed_path)
+        status = "rendered"
+
+    mockup = place_on_background(background.image, framed, position)
+    if output_path.suffix.lower() in {".jpg", ".jpeg"}:
+        mockup = mockup.convert("RGB")
+    mockup.save(output_path)
+    if mockup_path is not None:
+        _store_layer(output_path, mockup_path)
+
+    print(f"🖼️ {status.capitalize()}: {output_path.name}")
+    return status
+
+# Compose the mockup (only when run as a script)
+if __name__ == "__main__":
+    compose_mockup()
+
+    # Smaller artwork in the upper third, with stretched edges
+    # compose_mockup(position=(0.5, 0.33), scale=0.3, mode="stretch")
+
+    # Render without touching the cache
+    # compose_mockup(cache_dir=None)
+
+    # Print confirmation message
+    print("\n✅ compose.py successfully executed")
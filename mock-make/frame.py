@@ -2,15 +2,19 @@
 from PIL import Image
 
 # Import standard libraries
+import zlib
+import struct
 from pathlib import Path
 
 # Import project-specific modules
-from load import load_assets, BACKGROUND_PATH, FRAME_PATH, ARTWORK_PATH
+from load import load_assets, asset_stats, BACKGROUND_PATH, FRAME_PATH, ARTWORK_PATH
 
 # Define constants
 EDGE_SLICE = 40  # Frame slice thickness in pixels
 CURRENT_DIR = Path(__file__).parent
 OUTPUT_PATH = CURRENT_DIR / "output.png"
+STRIP_HEIGHT = 256  # Rows rendered and encoded at once by save_frame_tiled
+DIRECT_TILES = 8  # Sides needing at most this many tiles skip the doubling copies
 
 # Function to slice frame edges into corners and sides
 """
@@ -49,19 +53,95 @@ def slice_frame_edges(frame_img, edge_width):
         "left_edge": left_edge
     }
 
+# Function to tile or stretch a frame slice along one side of an image
+"""
+Fill `length` pixels along one side of an image with a frame slice.
+
+A side of a few tiles pastes the slice directly, one paste per tile. A
+longer side pastes it once and then doubles the filled span in place, so
+n tiles need about log2(n) paste calls. The last tile is cropped so the
+side never spills past `length`.
+
+Args:
+    canvas (Image.Image): Image to paste into.
+    edge (Image.Image): Frame slice to repeat along the side.
+    position (tuple): Top-left corner of the side in the canvas.
+    length (int): Length of the side along its main axis.
+    horizontal (bool): True for top/bottom sides, False for left/right.
+    mode (str): 'tile' repeats the slice, 'stretch' resizes it to length.
+"""
+def _paste_edge(canvas, edge, position, length, horizontal, mode="tile"):
+    tile_len = edge.width if horizontal else edge.height
+    thickness = edge.height if horizontal else edge.width
+    x, y = position
+
+    def box(start, span):
+        if horizontal:
+            return (start, 0, start + span, thickness)
+        return (0, start, thickness, start + span)
+
+    def at(offset):
+        return (x + offset, y) if horizontal else (x, y + offset)
+
+    if mode == "stretch":
+        canvas.paste(edge.resize((length, thickness) if horizontal else (thickness, length), Image.BICUBIC), at(0))
+        return
+    if mode != "tile":
+        raise ValueError(f"Unsupported edge mode: {mode}")
+
+    if -(-length // tile_len) <= DIRECT_TILES:
+        for offset in range(0, length, tile_len):
+            tile = edge if offset + tile_len <= length else edge.crop(box(0, length - offset))
+            canvas.paste(tile, at(offset))
+        return
+
+    canvas.paste(edge, at(0))
+
+    # Double the filled span until the side is complete
+    filled = tile_len
+    while filled < length:
+        span = min(filled, length - filled)
+        region = box(0, span)
+        region = (region[0] + x, region[1] + y, region[2] + x, region[3] + y)
+        canvas.paste(canvas.crop(region), at(filled))
+        filled += span
+
+# Function to build one edge strip of a given length in a single pass
+"""
+Build a standalone edge strip by tiling or stretching a frame slice.
+
+Args:
+    edge (Image.Image): Frame slice to repeat along the strip.
+    length (int): Length of the strip along its main axis.
+    horizontal (bool): True for top/bottom strips, False for left/right.
+    mode (str): 'tile' repeats the slice, 'stretch' resizes it to length.
+
+Returns:
+    Image.Image: Edge strip cropped to exactly `length`.
+"""
+def build_edge_strip(edge, length, horizontal, mode="tile"):
+    thickness = edge.height if horizontal else edge.width
+    strip = Image.new(edge.mode, (length, thickness) if horizontal else (thickness, length))
+    _paste_edge(strip, edge, (0, 0), length, horizontal, mode)
+    return strip
+
 # Function to build a dynamic frame around an artwork
 """
 Construct a dynamic frame image around an artwork using sliced parts.
 
+Each side is tiled straight into the frame; long sides double the filled
+span instead of pasting the slice once per repetition.
+
 Args:
     artwork_size (tuple): Width and height of the artwork.
     frame_parts (dict): Dictionary of sliced frame images.
     edge_width (int): Width of the frame edges.
+    mode (str): 'tile' repeats edge slices, 'stretch' resizes them.
 
 Returns:
     Image.Image: Composite frame image.
 """
-def build_frame(artwork_size, frame_parts, edge_width):
+def build_frame(artwork_size, frame_parts, edge_width, mode="tile"):
     art_w, art_h = artwork_size
     new_w = art_w + 2 * edge_width
     new_h = art_h + 2 * edge_width
@@ -75,30 +155,183 @@ def build_frame(artwork_size, frame_parts, edge_width):
     result.paste(frame_parts["bottom_right"], (new_w - edge_width, new_h - edge_width))
 
     # Place top and bottom edges
-    for x in range(edge_width, new_w - edge_width, frame_parts["top_edge"].width):
-        result.paste(frame_parts["top_edge"], (x, 0))
-        result.paste(frame_parts["bottom_edge"], (x, new_h - edge_width))
+    if art_w > 0:
+        _paste_edge(result, frame_parts["top_edge"], (edge_width, 0), art_w, True, mode)
+        _paste_edge(result, frame_parts["bottom_edge"], (edge_width, new_h - edge_width), art_w, True, mode)
 
     # Place left and right edges
-    for y in range(edge_width, new_h - edge_width, frame_parts["left_edge"].height):
-        result.paste(frame_parts["left_edge"], (0, y))
-        result.paste(frame_parts["right_edge"], (new_w - edge_width, y))
+    if art_h > 0:
+        _paste_edge(result, frame_parts["left_edge"], (0, edge_width), art_h, False, mode)
+        _paste_edge(result, frame_parts["right_edge"], (new_w - edge_width, edge_width), art_h, False, mode)
 
     return result
 
-# Load assets
-assets = load_assets(
-    background_path=BACKGROUND_PATH,
-    frame_path=FRAME_PATH,
-    artwork_path=ARTWORK_PATH
-)
+# Writer that encodes a PNG one horizontal strip at a time
+"""
+Minimal streaming PNG encoder for 8-bit RGB/RGBA images.
+
+Rows are compressed as they arrive and written out as IDAT chunks, so only
+the current strip is ever held in memory. Every row uses filter type 0,
+which trades some file size for not buffering previous rows.
+
+Args:
+    path (Path): Destination .png file.
+    size (tuple): Full image (width, height).
+    mode (str): 'RGB' or 'RGBA'.
+    compress_level (int): zlib compression level (0-9).
+"""
+class _PngStripWriter:
+    _COLOR_TYPES = {"RGB": 2, "RGBA": 6}
+
+    def __init__(self, path, size, mode="RGB", compress_level=6):
+        if mode not in self._COLOR_TYPES:
+            raise ValueError(f"Unsupported PNG mode: {mode}")
+        self.size = size
+        self.mode = mode
+        self.rows_written = 0
+        self._compressor = zlib.compressobj(compress_level)
+        self._file = open(path, "wb")
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", size[0], size[1], 8, self._COLOR_TYPES[mode], 0, 0, 0))
+
+    def _chunk(self, kind, data):
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(kind)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+    # Function to compress and write the rows of one strip
+    def write_strip(self, strip):
+        if strip.mode != self.mode or strip.width != self.size[0]:
+            raise ValueError("Strip does not match the image mode or width")
+        raw = strip.tobytes()
+        stride = len(raw) // strip.height
+        rows = b"".join(b"\x00" + raw[i:i + stride] for i in range(0, len(raw), stride))
+        data = self._compressor.compress(rows)
+        if data:
+            self._chunk(b"IDAT", data)
+        self.rows_written += strip.height
+
+    # Function to finish the stream and close the file
+    def close(self):
+        if self.rows_written != self.size[1]:
+            self.abort()
+            raise ValueError(f"Wrote {self.rows_written} of {self.size[1]} rows")
+        self._chunk(b"IDAT", self._compressor.flush())
+        self._chunk(b"IEND", b"")
+        self._file.close()
+
+    # Function to close the file after a failed render
+    def abort(self):
+        self._file.close()
+
+# Generator to render a frame as horizontal strips
+"""
+Render the same frame as build_frame, one horizontal strip at a time.
+
+The four edge strips are built once (their size grows with the perimeter,
+not the area) and each output strip only pastes the parts that cross it,
+so memory is proportional to `strip_height` times the frame width.
+
+Args:
+    artwork_size (tuple): Width and height of the artwork.
+    frame_parts (dict): Dictionary of sliced frame images.
+    edge_width (int): Width of the frame edges.
+    strip_height (int): Rows per strip.
+    mode (str): 'tile' repeats edge slices, 'stretch' resizes them.
+    image_mode (str): Mode of the yielded strips ('RGB' or 'RGBA').
+
+Yields:
+    tuple: (top row, Image.Image strip) from top to bottom.
+"""
+def iter_frame_strips(artwork_size, frame_parts, edge_width, strip_height=STRIP_HEIGHT,
+                      mode="tile", image_mode="RGB"):
+    art_w, art_h = artwork_size
+    new_w = art_w + 2 * edge_width
+    new_h = art_h + 2 * edge_width
+
+    # (part, x, y) placements in full-frame coordinates, in build_frame's paste order
+    placements = []
+    if art_w > 0:
+        placements.append((build_edge_strip(frame_parts["top_edge"], art_w, True, mode), edge_width, 0))
+        placements.append((build_edge_strip(frame_parts["bottom_edge"], art_w, True, mode), edge_width, new_h - edge_width))
+    if art_h > 0:
+        placements.append((build_edge_strip(frame_parts["left_edge"], art_h, False, mode), 0, edge_width))
+        placements.append((build_edge_strip(frame_parts["right_edge"], art_h, False, mode), new_w - edge_width, edge_width))
+    placements.append((frame_parts["top_left"], 0, 0))
+    placements.append((frame_parts["top_right"], new_w - edge_width, 0))
+    placements.append((frame_parts["bottom_left"], 0, new_h - edge_width))
+    placements.append((frame_parts["bottom_right"], new_w - edge_width, new_h - edge_width))
+    placements = [(part.convert(image_mode), x, y) for part, x, y in placements]
+
+    for top in range(0, new_h, strip_height):
+        bottom = min(top + strip_height, new_h)
+        strip = Image.new(image_mode, (new_w, bottom - top), (0,) * len(image_mode))
+        for part, x, y in placements:
+            if y < bottom and y + part.height > top:
+                # Only the rows of the part that fall inside this strip
+                rows = part.crop((0, max(0, top - y), part.width, min(part.height, bottom - y)))
+                strip.paste(rows, (x, max(y, top) - top))
+        yield top, strip
+
+# Function to render and encode a frame without holding it in memory
+"""
+Render a frame strip by strip and stream it into a PNG file.
+
+Produces the same pixels as build_frame(...).convert(image_mode).save(...)
+without ever allocating the full image, so print-resolution frames need
+memory proportional to the strip height rather than the image area.
+
+Args:
+    artwork_size (tuple): Width and height of the artwork.
+    frame_parts (dict): Dictionary of sliced frame images.
+    edge_width (int): Width of the frame edges.
+    output_path (Path): Destination .png file.
+    strip_height (int): Rows rendered and encoded at once.
+    mode (str): 'tile' repeats edge slices, 'stretch' resizes them.
+    image_mode (str): 'RGB' (like frame.py's output) or 'RGBA'.
+    compress_level (int): zlib compression level (0-9).
+
+Returns:
+    Path: The written file.
+"""
+def save_frame_tiled(artwork_size, frame_parts, edge_width, output_path=OUTPUT_PATH,
+                     strip_height=STRIP_HEIGHT, mode="tile", image_mode="RGB", compress_level=6):
+    size = (artwork_size[0] + 2 * edge_width, artwork_size[1] + 2 * edge_width)
+    writer = _PngStripWriter(output_path, size, image_mode, compress_level)
+    try:
+        for _, strip in iter_frame_strips(artwork_size, frame_parts, edge_width, strip_height, mode, image_mode):
+            writer.write_strip(strip)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    return Path(output_path)
+
+# Build the frame (only when run as a script)
+if __name__ == "__main__":
+    # Load assets
+    assets = load_assets(
+        background_path=BACKGROUND_PATH,
+        frame_path=FRAME_PATH,
+        artwork_path=ARTWORK_PATH
+    )
+
+    # Generate frame and save output
+    frame_parts = slice_frame_edges(assets["frame"], EDGE_SLICE)
+    dynamic_frame = build_frame(assets["artwork"].size, frame_parts, EDGE_SLICE)
+    dynamic_frame.convert("RGB").save(OUTPUT_PATH)
+
+    # Stretch edge slices instead of tiling them
+    # dynamic_frame = build_frame(assets["artwork"].size, frame_parts, EDGE_SLICE, mode="stretch")
+
+    # Print-resolution artworks: render and encode in strips with bounded memory
+    # save_frame_tiled(assets["artwork"].size, frame_parts, EDGE_SLICE, OUTPUT_PATH)
 
-# Generate frame and save output
-frame_parts = slice_frame_edges(assets["frame"], EDGE_SLICE)
-dynamic_frame = build_frame(assets["artwork"].size, frame_parts, EDGE_SLICE)
-dynamic_frame.convert("RGB").save(OUTPUT_PATH)
+    print(f"[OK] Frame image saved to {OUTPUT_PATH}")
 
-print(f"[OK] Frame image saved to {OUTPUT_PATH}")
+    # The background is never decoded here; only the frame shows up as loaded
+    asset_stats(assets)
 
-# Print confirmation message
-print("\n✅ frame_builder.py successfully executed")
+    # Print confirmation message
+    print("\n✅ frame_builder.py successfully executed")
@@ -3,6 +3,7 @@ from PIL import Image
 
 # Import standard libraries
 from pathlib import Path
+import time
 
 # Get the directory of the current script
 CURRENT_DIR = Path(__file__).parent
@@ -12,57 +13,227 @@ BACKGROUND_PATH = CURRENT_DIR / "back.jpg"
 FRAME_PATH = CURRENT_DIR / "frame.jpg"
 ARTWORK_PATH = CURRENT_DIR / "art.jpg"
 
+# Mode every asset is converted to after decoding
+ASSET_MODE = "RGBA"
+
+# Function to pick the integer downscale factor for a target size
+"""
+Compute the largest integer factor that keeps an image at or above a target.
+
+Args:
+    size (tuple): Source (width, height).
+    target_size (tuple): Smallest acceptable (width, height).
+
+Returns:
+    int: Reduction factor, 1 when no reduction is possible.
+"""
+def _reduce_factor(size, target_size):
+    return max(1, min(size[0] // max(1, target_size[0]), size[1] // max(1, target_size[1])))
+
+# Lazy handle that reads the image header now and decodes pixels on first use
+"""
+Lazily decoded image asset.
+
+Only the file header is read on creation, so `size`, `width`, `height` and
+`mode` are available without touching pixel data. The image is decoded
+and converted to RGBA the first time anything else is accessed; all other
+attributes (crop, paste, show, ...) are forwarded to the decoded image.
+
+When `target_size` is given and the source is larger, decoding is reduced:
+JPEGs use draft mode (DCT scaling by 1/2, 1/4 or 1/8), other formats are
+reduced by an integer factor. Either way the result stays at or above
+`target_size`, so it can still be resized down with full quality.
+
+Args:
+    path (Path): Path to the image file.
+    target_size (tuple, optional): Smallest (width, height) the caller needs.
+
+Raises:
+    FileNotFoundError: If the image file does not exist.
+"""
+class LazyImage:
+    def __init__(self, path, target_size=None):
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Image not found: {path}")
+
+        self.path = path
+        self.target_size = tuple(target_size) if target_size else None
+        self.mode = ASSET_MODE
+        self.decode_time = None
+        self._image = None
+
+        with Image.open(path) as img:
+            self.format = img.format
+            self.source_size = img.size
+            self.size = self._decoded_size(img)
+
+    # Function to predict the decoded size without decoding
+    def _decoded_size(self, img):
+        if self.target_size is None:
+            return img.size
+        if img.format == "JPEG":
+            img.draft(img.mode, self.target_size)
+            return img.size
+        factor = _reduce_factor(img.size, self.target_size)
+        return (-(-img.size[0] // factor), -(-img.size[1] // factor))
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    @property
+    def loaded(self):
+        return self._image is not None
+
+    # Function to decode the image (once) and return it
+    def load(self):
+        if self._image is not None:
+            return self._image
+
+        start = time.perf_counter()
+        with Image.open(self.path) as img:
+            if self.target_size is not None:
+                if img.format == "JPEG":
+                    img.draft(img.mode, self.target_size)
+                else:
+                    factor = _reduce_factor(img.size, self.target_size)
+                    if factor > 1:
+                        img = img.reduce(factor)
+            image = img.convert(ASSET_MODE)
+        self.decode_time = time.perf_counter() - start
+
+        self._image = image
+        self.size = image.size
+        return image
+
+    @property
+    def image(self):
+        return self.load()
+
+    # Function to drop decoded pixels; the next access decodes again
+    def release(self):
+        self._image = None
+
+    # Function to report decode time and memory for this asset
+    def stats(self):
+        bands = len(ASSET_MODE)
+        return {
+            "path": str(self.path),
+            "format": self.format,
+            "source_size": self.source_size,
+            "size": self.size,
+            "loaded": self.loaded,
+            "decode_time": self.decode_time,
+            "bytes": self.size[0] * self.size[1] * bands if self.loaded else 0,
+            "full_bytes": self.source_size[0] * self.source_size[1] * bands
+        }
+
+    def __getattr__(self, name):
+        # Only reached for attributes not set above; never proxy private names
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "lazy"
+        return f"<LazyImage {self.path.name} {self.size[0]}x{self.size[1]} {state}>"
+
 # Function to load an image with error handling
 """
 Load an image from the given path and convert it to RGBA.
 
 Args:
     path (Path): Path to the image file.
+    target_size (tuple, optional): Smallest (width, height) needed; larger
+        images are decoded at reduced size (JPEG draft mode).
 
 Returns:
     Image.Image: The loaded PIL image in RGBA mode.
 """
-def load_image(path):
-    if not path.exists():
-        raise FileNotFoundError(f"Image not found: {path}")
-    return Image.open(path).convert("RGBA")
+def load_image(path, target_size=None):
+    return LazyImage(path, target_size).load()
 
 # Function to load all required assets
 """
-Load background, frame, and artwork images from given paths.
+Open background, frame, and artwork images as lazy handles.
+
+Nothing is decoded here: each handle decodes on first pixel access, so an
+asset the caller never uses (e.g. the background in frame.py) costs only
+a header read.
 
 Args:
     background_path (Path): Path to the background image.
     frame_path (Path): Path to the frame image.
     artwork_path (Path): Path to the artwork image.
+    target_sizes (dict, optional): Per-asset target sizes keyed by
+        'background', 'frame' or 'artwork'.
 
 Returns:
-    dict: Dictionary containing loaded PIL images.
+    dict: Dictionary containing LazyImage handles.
 """
-def load_assets(background_path, frame_path, artwork_path):
-    background = load_image(background_path)
-    frame = load_image(frame_path)
-    artwork = load_image(artwork_path)
+def load_assets(background_path, frame_path, artwork_path, target_sizes=None):
+    target_sizes = target_sizes or {}
+    paths = {
+        "background": background_path,
+        "frame": frame_path,
+        "artwork": artwork_path
+    }
 
     return {
-        "background": background,
-        "frame": frame,
-        "artwork": artwork
+        name: LazyImage(path, target_sizes.get(name))
+        for name, path in paths.items()
     }
 
-# Load and preview assets
-assets = load_assets(
-    background_path=BACKGROUND_PATH,
-    frame_path=FRAME_PATH,
-    artwork_path=ARTWORK_PATH
-)
+# Function to print decode stats for loaded assets
+"""
+Print decode time and memory for each asset handle.
+
+Args:
+    assets (dict): Dictionary of LazyImage handles from load_assets.
+
+Returns:
+    dict: Stats dictionary per asset name.
+"""
+def asset_stats(assets):
+    stats = {name: asset.stats() for name, asset in assets.items()}
+
+    print("\n📊 Asset stats:")
+    for name, info in stats.items():
+        if not info["loaded"]:
+            print(f"  {name}: {info['source_size']} not decoded")
+            continue
+        print(
+            f"  {name}: {info['source_size']} → {info['size']}, "
+            f"{info['decode_time'] * 1000:.1f} ms, "
+            f"{info['bytes'] / 2**20:.1f} MiB (full decode {info['full_bytes'] / 2**20:.1f} MiB)"
+        )
+
+    return stats
+
+# Load and preview assets (only when run as a script)
+if __name__ == "__main__":
+    assets = load_assets(
+        background_path=BACKGROUND_PATH,
+        frame_path=FRAME_PATH,
+        artwork_path=ARTWORK_PATH
+    )
+
+    # Decode previews at reduced size instead
+    # assets = load_assets(BACKGROUND_PATH, FRAME_PATH, ARTWORK_PATH, target_sizes={"background": (1024, 1024)})
+
+    assets["background"].show(title="Background")
+    assets["frame"].show(title="Frame")
+    assets["artwork"].show(title="Artwork")
 
-assets["background"].show(title="Background")
-assets["frame"].show(title="Frame")
-assets["artwork"].show(title="Artwork")
+    for name, img in assets.items():
+        print(f"{name}: {img.size}, {img.mode}")
 
-for name, img in assets.items():
-    print(f"{name}: {img.size}, {img.mode}")
+    asset_stats(assets)
 
-# Print confirmation message
-print("\n✅ asset_loader.py successfully executed")
+    # Print confirmation message
+    print("\n✅ asset_loader.py successfully executed")